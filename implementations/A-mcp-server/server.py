@@ -6,6 +6,8 @@ Exposes task CRUD as MCP tool calls for Claude Code and other MCP-capable agents
 
 Requirements:
     pip install mcp pyyaml
+    pip install orjson      # optional, faster JSON encoding
+    pip install numpy       # optional, faster sorting of large task lists
 
 Usage:
     python server.py           # Run MCP server (stdio transport)
@@ -13,7 +15,10 @@ Usage:
 """
 
 import argparse
+import contextlib
+import io
 import json
+import os
 import re
 import sys
 from datetime import date
@@ -28,10 +33,22 @@ except ImportError:
     HAS_MCP = False
 
 try:
-    import yaml
-    HAS_YAML = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_YAML = False
+    HAS_ORJSON = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:  # Windows
+    HAS_FCNTL = False
 
 IMPL_DIR = Path(__file__).parent
 TASKS_DIR = IMPL_DIR / "tasks"
@@ -39,96 +56,167 @@ FLAGGED_DIR = IMPL_DIR / "flagged"
 REPO_ROOT = IMPL_DIR.parent.parent
 SCRIPTS_DIR = REPO_ROOT / "scripts"
 
+sys.path.insert(0, str(SCRIPTS_DIR))
+from task_io import (HAS_YAML, load_task_frontmatter, load_yaml, render_frontmatter,
+                     render_task_frontmatter, scan_max_task_num, write_parts)
+
+_FM_CACHE_PATH = TASKS_DIR / ".fm_cache.json"
+# Bump whenever parse_fm_only / _minimal_yaml_parse change what they return; the
+# frontmatter cache tag includes it (and the parser in use) so stale entries are dropped.
+_FM_PARSE_VERSION = 1
+
 
 # ---------------------------------------------------------------------------
 # Frontmatter helpers
 # ---------------------------------------------------------------------------
 
-def parse_frontmatter(text: str) -> tuple[dict, str]:
+def _find_fm_bounds(text: str) -> tuple[int, int] | None:
+    """Return (start, end) of the frontmatter block, or None if there is none."""
     if not text.startswith("---"):
-        return {}, text
+        return None
     end = text.find("\n---", 3)
     if end == -1:
-        return {}, text
-    fm_text = text[3:end].strip()
-    body = text[end + 4:].strip()
+        return None
+    return 3, end
+
+
+def parse_fm_only(text: str) -> dict:
+    """Parse just the frontmatter dict; the body is never sliced."""
+    bounds = _find_fm_bounds(text)
+    if bounds is None:
+        return {}
+    fm_text = text[bounds[0]:bounds[1]].strip()
     if HAS_YAML:
-        try:
-            fm = yaml.safe_load(fm_text) or {}  # type: ignore[possibly-undefined]
-        except yaml.YAMLError:  # type: ignore[possibly-undefined]
-            fm = {}
-    else:
-        fm = _minimal_yaml_parse(fm_text)
-    return fm, body
+        return load_yaml(fm_text) or {}
+    return _minimal_yaml_parse(fm_text)
+
+
+def parse_frontmatter(text: str) -> tuple[dict, str]:
+    bounds = _find_fm_bounds(text)
+    if bounds is None:
+        return {}, text
+    return parse_fm_only(text), text[bounds[1] + 4:].strip()
+
+
+_KV_RE = re.compile(r'^(\w[\w_-]*):[ \t]*(.+)$', re.MULTILINE)
+_FLOAT_RE = re.compile(r'\d+\.\d+')
 
 
 def _minimal_yaml_parse(text: str) -> dict:
     fm: dict = {}
-    for line in text.splitlines():
-        m = re.match(r'^(\w[\w_-]*):\s*(.+)$', line)
-        if m:
-            key, val = m.group(1), m.group(2).strip().strip('"\'')
-            if val.lower() in ("null", "~"):
-                fm[key] = None
-            elif re.match(r'^\d+\.\d+$', val):
-                fm[key] = float(val)
-            elif re.match(r'^\d+$', val):
-                fm[key] = int(val)
-            else:
-                fm[key] = val
+    for m in _KV_RE.finditer(text):
+        key, val = m.group(1), m.group(2).strip().strip('"\'')
+        if val.lower() in ("null", "~"):
+            fm[key] = None
+        elif _FLOAT_RE.fullmatch(val):
+            fm[key] = float(val)
+        elif val.isdecimal():
+            fm[key] = int(val)
+        else:
+            fm[key] = val
     return fm
 
 
-def render_frontmatter(fm: dict) -> str:
-    lines = []
-    for key, val in fm.items():
-        if val is None:
-            lines.append(f"{key}: null")
-        elif isinstance(val, list):
-            lines.append(f"{key}: {json.dumps(val)}")
-        elif isinstance(val, str):
-            # Guard: if a string looks like a JSON array (corrupted round-trip),
-            # parse it back to a list and emit properly.
-            stripped = val.strip()
-            if stripped.startswith("[") and stripped.endswith("]"):
-                try:
-                    import json as _j
-                    parsed = _j.loads(stripped)
-                    if isinstance(parsed, list):
-                        lines.append(f"{key}: {json.dumps(parsed)}")
-                        continue
-                except ValueError:
-                    pass
-            lines.append(f'{key}: "{val}"')
-        elif isinstance(val, float):
-            lines.append(f"{key}: {val:.1f}")
-        else:
-            lines.append(f"{key}: {val}")
-    return "\n".join(lines)
+_KEY_LINE_RE = re.compile(r'^(\w[\w_-]*):.*$', re.MULTILINE)
+
+
+def _fm_line_offsets(text: str) -> tuple[dict[str, tuple[int, int]], int] | None:
+    """
+    Map each frontmatter key to the (start, end) span of its line, and return it with
+    the offset of the closing `---` marker.
+
+    Returns None when there is no frontmatter or it is not flat `key: value` lines
+    (indented continuations, block lists), in which case callers re-render it whole.
+    """
+    bounds = _find_fm_bounds(text)
+    if bounds is None:
+        return None
+    start, end = bounds
+    for line in text[start:end].split("\n"):
+        if line and line[0] in " \t-":
+            return None
+    offsets = {m.group(1): m.span() for m in _KEY_LINE_RE.finditer(text, start, end)}
+    return offsets, end
+
+
+def _splice_frontmatter(text: str, offsets: dict[str, tuple[int, int]], fm_end: int,
+                        changes: dict) -> list[str]:
+    """Return text as pieces with changed keys' lines replaced and new keys appended."""
+    edits = sorted((*offsets[key], render_frontmatter({key: val}))
+                   for key, val in changes.items() if key in offsets)
+    pieces, pos = [], 0
+    for line_start, line_end, line in edits:
+        pieces += [text[pos:line_start], line]
+        pos = line_end
+    pieces.append(text[pos:fm_end])
+    pieces += [f"\n{render_frontmatter({key: val})}"
+               for key, val in changes.items() if key not in offsets]
+    pieces.append(text[fm_end:])
+    return pieces
+
+
+_FM_OPEN = b"---\n"
+_FM_CLOSE = b"\n---\n\n"
+
+
+def _write_task_text(path: Path, fm: dict, body: str) -> None:
+    """Write frontmatter + body as separate buffers instead of one concatenated string."""
+    parts = [_FM_OPEN, render_task_frontmatter(fm).encode("utf-8"), _FM_CLOSE, body.encode("utf-8")]
+    write_parts(path, parts)
 
 
 # ---------------------------------------------------------------------------
 # Task operations
 # ---------------------------------------------------------------------------
 
-def next_task_id() -> str:
-    existing = list(TASKS_DIR.glob("TASK-*.md")) + list(FLAGGED_DIR.glob("TASK-*.md"))
-    nums = []
-    for f in existing:
-        m = re.match(r"TASK-(\d+)", f.stem)
-        if m:
-            nums.append(int(m.group(1)))
-    return f"TASK-{(max(nums) + 1):03d}" if nums else "TASK-001"
+def _dir_mtime_ns(dirpath: Path) -> int:
+    try:
+        return os.stat(dirpath).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+@contextlib.contextmanager
+def reserve_task_id():
+    """
+    Reserve the next TASK-NNN id for the duration of a with-block that writes the task.
+
+    The counter is kept in tasks/.next_id (locked with flock where available, so
+    concurrent MCP calls never get the same id) together with the mtimes of the tasks
+    and flagged directories as they were after the last task was written. The counter is
+    only a floor: whenever either directory has changed since — e.g. extract_tasks.py
+    wrote tasks directly — it is raised to one past the highest TASK-NNN found there.
+    The counter only advances when the block completes, so a failed write loses no id.
+    """
+    TASKS_DIR.mkdir(parents=True, exist_ok=True)
+    fd = os.open(TASKS_DIR / ".next_id", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if HAS_FCNTL:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        fields = os.read(fd, 128).split()
+        num = int(fields[0]) if fields and fields[0].isdigit() else 0
+        mtimes = [_dir_mtime_ns(TASKS_DIR), _dir_mtime_ns(FLAGGED_DIR)]
+        if num <= 0 or [int(f) for f in fields[1:3] if f.isdigit()] != mtimes:
+            num = max(num, scan_max_task_num(TASKS_DIR, FLAGGED_DIR) + 1)
+        yield f"TASK-{num:03d}"
+        # Our own write just changed the tasks dir; record that state so the next
+        # reservation only rescans if something else touches the directories.
+        mtimes = [_dir_mtime_ns(TASKS_DIR), _dir_mtime_ns(FLAGGED_DIR)]
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{num + 1} {mtimes[0]} {mtimes[1]}".encode())
+    finally:
+        os.close(fd)  # also releases the flock
 
 
 def load_all_tasks() -> list[dict]:
     TASKS_DIR.mkdir(parents=True, exist_ok=True)
+    tag = f"server:{'yaml' if HAS_YAML else 'minimal'}:{_FM_PARSE_VERSION}"
+    loaded = load_task_frontmatter(TASKS_DIR, parse_fm_only, _FM_CACHE_PATH, tag=tag)
     tasks = []
-    for path in sorted(TASKS_DIR.glob("TASK-*.md")):
-        text = path.read_text(encoding="utf-8")
-        fm, _ = parse_frontmatter(text)
+    for path, fm in loaded:
         if fm:
-            fm["_path"] = str(path)
+            fm["_path"] = path
             tasks.append(fm)
     return tasks
 
@@ -139,8 +227,7 @@ def write_task_file(task_id: str, fm: dict, body: str = "") -> Path:
     title = fm.get("title", task_id)
     if not body:
         body = f"# {title}\n\n> Run `python3 scripts/score_tasks.py` to compute final score.\n\n## Context\n\n## Acceptance criteria\n\n## Notes\n"
-    content = f"---\n{render_frontmatter(fm)}\n---\n\n{body}"
-    path.write_text(content, encoding="utf-8")
+    _write_task_text(path, fm, body)
     return path
 
 
@@ -148,6 +235,24 @@ def write_task_file(task_id: str, fm: dict, body: str = "") -> Path:
 # Tool implementations
 # ---------------------------------------------------------------------------
 
+# Below this many tasks building a numpy array costs more than list.sort saves.
+_NUMPY_SORT_MIN = 256
+
+
+def _sort_by_score(tasks: list[dict]) -> list[dict]:
+    """Tasks by descending score (unscored counts as 0), ties kept in input order."""
+    if HAS_NUMPY and len(tasks) >= _NUMPY_SORT_MIN:
+        try:
+            scores = np.fromiter((t.get("score") or 0 for t in tasks),
+                                 dtype=np.float64, count=len(tasks))
+        except (TypeError, ValueError):
+            pass  # non-numeric score somewhere; let list.sort deal with it
+        else:
+            # stable sort on negated scores == list.sort(reverse=True) tie order
+            return [tasks[i] for i in np.argsort(-scores, kind="stable")]
+    return sorted(tasks, key=lambda t: (t.get("score") or 0), reverse=True)
+
+
 def tool_list_tasks(params: dict) -> str:
     tasks = load_all_tasks()
     status_filter = params.get("status")
@@ -175,7 +280,7 @@ def tool_list_tasks(params: dict) -> str:
             continue
         filtered.append(t)
 
-    filtered.sort(key=lambda t: (t.get("score") or 0), reverse=True)
+    filtered = _sort_by_score(filtered)
 
     if not filtered:
         return "No tasks found matching the given filters."
@@ -193,28 +298,28 @@ def tool_list_tasks(params: dict) -> str:
 
 def tool_create_task(params: dict) -> str:
     today = date.today().isoformat()
-    task_id = next_task_id()
-
-    fm = {
-        "id": task_id,
-        "title": params.get("title", "Untitled task"),
-        "status": "todo",
-        "assignee": params.get("assignee", "unassigned"),
-        "priority": params.get("priority", "medium"),
-        "score": None,
-        "urgency": None,
-        "impact": None,
-        "effort": None,
-        "created_date": today,
-        "updated_date": today,
-        "due_date": params.get("due_date", None),
-        "labels": params.get("labels", []),
-        "dependencies": params.get("dependencies", []),
-        "source": params.get("source", "manual"),
-        "confidence": params.get("confidence", 1.0),
-    }
+    with reserve_task_id() as task_id:
+        fm = {
+            "id": task_id,
+            "title": params.get("title", "Untitled task"),
+            "status": "todo",
+            "assignee": params.get("assignee", "unassigned"),
+            "priority": params.get("priority", "medium"),
+            "score": None,
+            "urgency": None,
+            "impact": None,
+            "effort": None,
+            "created_date": today,
+            "updated_date": today,
+            "due_date": params.get("due_date", None),
+            "labels": params.get("labels", []),
+            "dependencies": params.get("dependencies", []),
+            "source": params.get("source", "manual"),
+            "confidence": params.get("confidence", 1.0),
+        }
+
+        path = write_task_file(task_id, fm)
 
-    path = write_task_file(task_id, fm)
     return f"Created {task_id}: {fm['title']}\nFile: {path}\nRun score_tasks to compute score."
 
 
@@ -228,14 +333,19 @@ def tool_update_task(params: dict) -> str:
         return f"Error: task {task_id} not found"
 
     text = path.read_text(encoding="utf-8")
-    fm, body = parse_frontmatter(text)
-
     update_fields = {k: v for k, v in params.items() if k != "id"}
-    fm.update(update_fields)
-    fm["updated_date"] = date.today().isoformat()
-
-    content = f"---\n{render_frontmatter(fm)}\n---\n\n{body}"
-    path.write_text(content, encoding="utf-8")
+    changes = {**update_fields, "updated_date": date.today().isoformat()}
+
+    located = _fm_line_offsets(text)
+    if located is not None:
+        # Rewrite only the affected lines; the rest of the file is left byte-for-byte.
+        offsets, fm_end = located
+        pieces = _splice_frontmatter(text, offsets, fm_end, changes)
+        write_parts(path, [piece.encode("utf-8") for piece in pieces])
+    else:
+        fm, body = parse_frontmatter(text)
+        fm.update(changes)
+        _write_task_text(path, fm, body)
     return f"Updated {task_id}: {', '.join(update_fields.keys())}"
 
 
@@ -255,8 +365,7 @@ def tool_complete_task(params: dict) -> str:
     fm["updated_date"] = today
     fm["completed_date"] = today
 
-    content = f"---\n{render_frontmatter(fm)}\n---\n\n{body}"
-    path.write_text(content, encoding="utf-8")
+    _write_task_text(path, fm, body)
     return f"Completed {task_id}: {fm.get('title', '')}"
 
 
@@ -266,13 +375,24 @@ def tool_score_tasks(params: dict) -> str:
     if not score_script.exists():
         return f"Error: scoring script not found at {score_script}"
 
-    import subprocess
-    cmd = [sys.executable, str(score_script), "--impl", "A"]
+    # Run in-process (scripts/ is already on sys.path) rather than paying for a fresh
+    # interpreter per call. Capturing stdout also keeps the MCP stdio stream clean.
+    try:
+        import score_tasks
+    except ImportError as e:
+        return f"Error: could not import scoring script: {e}"
+
+    argv = ["--impl", "A"]
     if dry_run:
-        cmd.append("--dry-run")
+        argv.append("--dry-run")
 
-    result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(REPO_ROOT))
-    output = result.stdout + result.stderr
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+        try:
+            score_tasks.main(argv)
+        except SystemExit:
+            pass
+    output = buf.getvalue()
     return output if output else "Scoring complete (no output)"
 
 
@@ -417,9 +537,12 @@ def install():
         "args": [str(Path(__file__).resolve())],
     }
 
-    mcp_json.write_text(json.dumps(config, indent=2))
-    print(f"Installed MCP server config to {mcp_json}")
-    print("Restart Claude Code to pick up the new MCP server.")
+    if HAS_ORJSON:
+        mcp_json.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))  # type: ignore[possibly-undefined]
+    else:
+        mcp_json.write_text(json.dumps(config, indent=2))
+    sys.stdout.write(f"Installed MCP server config to {mcp_json}\n"
+                     "Restart Claude Code to pick up the new MCP server.\n")
 
 
 if __name__ == "__main__":
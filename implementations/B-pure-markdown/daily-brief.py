@@ -11,11 +11,23 @@ Usage:
 
 import argparse
 import re
+import sys
 from datetime import date
 from pathlib import Path
 
 IMPL_DIR = Path(__file__).parent
 TASKS_DIR = IMPL_DIR / "tasks"
+REPO_ROOT = IMPL_DIR.parent.parent
+
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+from task_io import load_task_frontmatter
+
+_FM_CACHE_PATH = TASKS_DIR / ".fm_cache.json"
+# Bump whenever parse_frontmatter changes what it returns, so cached entries are dropped.
+_FM_PARSE_VERSION = 1
+
+_KV_RE = re.compile(r'^(\w[\w_-]*):[ \t]*(.*)$', re.MULTILINE)
+_FLOAT_RE = re.compile(r'\d+\.\d+')
 
 
 def parse_args():
@@ -36,64 +48,82 @@ def parse_frontmatter(text: str) -> dict:
         return {}
     fm_text = text[3:end].strip()
     fm: dict = {}
-    for line in fm_text.splitlines():
-        m = re.match(r'^(\w[\w_-]*):\s*(.*)$', line)
-        if m:
-            key, val = m.group(1), m.group(2).strip().strip('"\'')
-            if val.lower() in ("null", "~", ""):
-                fm[key] = None
-            elif re.match(r'^\d+\.\d+$', val):
-                fm[key] = float(val)
-            elif re.match(r'^\d+$', val):
-                fm[key] = int(val)
-            else:
-                fm[key] = val
+    for m in _KV_RE.finditer(fm_text):
+        key, val = m.group(1), m.group(2).strip().strip('"\'')
+        if val.lower() in ("null", "~", ""):
+            fm[key] = None
+        elif _FLOAT_RE.fullmatch(val):
+            fm[key] = float(val)
+        elif val.isdecimal():
+            fm[key] = int(val)
+        else:
+            fm[key] = val
     return fm
 
 
+# One bit per schema status so the per-file filter is an int test, not a set lookup.
+_STATUS_BITS = {"todo": 1, "in-progress": 2, "review": 4, "done": 8, "blocked": 16}
+
+
 def load_tasks(statuses: set[str], assignee: str | None) -> list[dict]:
     if not TASKS_DIR.exists():
         return []
 
+    mask = 0
+    for s in statuses:
+        mask |= _STATUS_BITS.get(s, 0)
+    # Statuses outside the schema (rare) still go through plain set membership.
+    extra = frozenset(s for s in statuses if s not in _STATUS_BITS)
+
+    loaded = load_task_frontmatter(TASKS_DIR, parse_frontmatter, _FM_CACHE_PATH,
+                                   tag=f"daily-brief:{_FM_PARSE_VERSION}")
+
     tasks = []
-    for path in TASKS_DIR.glob("TASK-*.md"):
-        text = path.read_text(encoding="utf-8")
-        fm = parse_frontmatter(text)
+    for path, fm in loaded:
         if not fm:
             continue
-        if fm.get("status") not in statuses:
+        status = fm.get("status")
+        if not (_STATUS_BITS.get(status, 0) & mask) and status not in extra:
             continue
         if assignee and fm.get("assignee") != assignee:
             continue
-        fm["_path"] = str(path)
+        fm["_path"] = path
         tasks.append(fm)
 
     return sorted(tasks, key=lambda t: (t.get("score") or 0), reverse=True)
 
 
+# Indexed by round(score) and int(score) respectively, clamped to 0-10.
+_BARS = tuple("█" * i + "░" * (10 - i) for i in range(11))
+_LABELS = tuple(
+    "CRITICAL" if i >= 8 else "HIGH    " if i >= 6 else "MEDIUM  " if i >= 4 else "LOW     "
+    for i in range(11)
+)
+
+
+_STATUS_ICON = {
+    "todo": "○",
+    "in-progress": "◐",
+    "review": "◑",
+    "done": "●",
+    "blocked": "✗",
+}
+
+
 def priority_bar(score: float | None) -> str:
     if score is None:
         return "░░░░░░░░░░ (unscored)"
-    filled = round(score)
-    empty = 10 - filled
-    bar = "█" * filled + "░" * empty
-    if score >= 8:
-        label = "CRITICAL"
-    elif score >= 6:
-        label = "HIGH    "
-    elif score >= 4:
-        label = "MEDIUM  "
-    else:
-        label = "LOW     "
+    bar = _BARS[min(10, max(0, round(score)))]
+    label = _LABELS[min(10, max(0, int(score)))]
     return f"{bar} {score:.1f} {label}"
 
 
-def due_indicator(due_date: str | None) -> str:
+def due_indicator(due_date: str | None, today: date) -> str:
     if not due_date or due_date == "null":
         return ""
     try:
         due = date.fromisoformat(str(due_date))
-        days = (due - date.today()).days
+        days = (due - today).days
         if days < 0:
             return f" ⚠️  OVERDUE ({abs(days)}d ago)"
         elif days == 0:
@@ -110,7 +140,7 @@ def due_indicator(due_date: str | None) -> str:
 
 def main():
     args = parse_args()
-    today = date.today().isoformat()
+    today = date.today()
 
     if args.all:
         statuses = {"todo", "in-progress", "review", "done", "blocked"}
@@ -119,21 +149,25 @@ def main():
 
     tasks = load_tasks(statuses, args.assignee)
 
-    print(f"\n{'='*60}")
-    print(f"  DAILY BRIEF — {today}")
-    print(f"  Implementation B (Pure Markdown)")
-    print(f"{'='*60}")
+    # Collect the whole brief and emit it with one write instead of a print per line.
+    out = [
+        f"\n{'='*60}",
+        f"  DAILY BRIEF — {today.isoformat()}",
+        f"  Implementation B (Pure Markdown)",
+        f"{'='*60}",
+    ]
 
     if not tasks:
-        print("\n  No tasks found.")
-        print(f"  Task directory: {TASKS_DIR}")
-        print("\n  To create tasks:")
-        print("    python ../../scripts/extract_tasks.py ../../meeting-notes/<file>.md --impl B")
-        print(f"{'='*60}\n")
+        out.append("\n  No tasks found.")
+        out.append(f"  Task directory: {TASKS_DIR}")
+        out.append("\n  To create tasks:")
+        out.append("    python ../../scripts/extract_tasks.py ../../meeting-notes/<file>.md --impl B")
+        out.append(f"{'='*60}\n")
+        sys.stdout.write("\n".join(out) + "\n")
         return
 
     shown = tasks[:args.limit]
-    print(f"\n  Showing {len(shown)} of {len(tasks)} task(s) | statuses: {', '.join(sorted(statuses))}\n")
+    out.append(f"\n  Showing {len(shown)} of {len(tasks)} task(s) | statuses: {', '.join(sorted(statuses))}\n")
 
     for task in shown:
         task_id = task.get("id", "?")
@@ -142,31 +176,25 @@ def main():
         assignee = task.get("assignee", "unassigned")
         score = task.get("score")
         due = task.get("due_date")
+        status_icon = _STATUS_ICON.get(status, "?")
 
-        status_icon = {
-            "todo": "○",
-            "in-progress": "◐",
-            "review": "◑",
-            "done": "●",
-            "blocked": "✗",
-        }.get(status, "?")
-
-        print(f"  {status_icon} {task_id}  [{assignee}]")
-        print(f"    {title[:56]}{due_indicator(due)}")
-        print(f"    {priority_bar(score)}")
-        print()
+        out.append(f"  {status_icon} {task_id}  [{assignee}]")
+        out.append(f"    {title[:56]}{due_indicator(due, today)}")
+        out.append(f"    {priority_bar(score)}")
+        out.append("")
 
     if len(tasks) > args.limit:
-        print(f"  ... and {len(tasks) - args.limit} more. Use --limit to see more.\n")
+        out.append(f"  ... and {len(tasks) - args.limit} more. Use --limit to see more.\n")
 
     # Summary
     todo_count = sum(1 for t in tasks if t.get("status") == "todo")
     in_prog = sum(1 for t in tasks if t.get("status") == "in-progress")
     blocked = sum(1 for t in tasks if t.get("status") == "blocked")
 
-    print(f"{'='*60}")
-    print(f"  Summary: {todo_count} todo | {in_prog} in-progress | {blocked} blocked")
-    print(f"{'='*60}\n")
+    out.append(f"{'='*60}")
+    out.append(f"  Summary: {todo_count} todo | {in_prog} in-progress | {blocked} blocked")
+    out.append(f"{'='*60}\n")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
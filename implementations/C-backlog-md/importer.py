@@ -11,19 +11,28 @@ Usage:
 """
 
 import argparse
+import functools
+import os
+import shutil
 import subprocess
 import sys
+import time
 from datetime import date
 from pathlib import Path
 
 IMPL_DIR = Path(__file__).parent
 REPO_ROOT = IMPL_DIR.parent.parent
 BACKLOG_DIR = IMPL_DIR / "backlog"
+CLI_PROBE_CACHE = (Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+                   / "notes-to-tasks" / "backlog_present")
+# How long a successful probe is trusted before `backlog --version` runs again.
+CLI_PROBE_TTL = 24 * 60 * 60
 
 # Reuse extraction logic from shared scripts
 sys.path.insert(0, str(REPO_ROOT / "scripts"))
 try:
     from extract_tasks import extract_action_items, parse_action_item
+    from task_io import write_parts
     HAS_EXTRACT = True
 except ImportError:
     HAS_EXTRACT = False
@@ -36,22 +45,72 @@ def parse_args():
     return parser.parse_args()
 
 
+@functools.lru_cache(maxsize=1)
 def backlog_cli_available() -> bool:
+    """Probe for the backlog CLI once per process.
+
+    A successful probe is also kept on disk for CLI_PROBE_TTL seconds, keyed by the
+    resolved executable path and its mtime, so batch imports don't spawn
+    `backlog --version` (a Node.js startup) for every note; reinstalling or upgrading the
+    CLI changes the key and forces a fresh probe. Failures (including a timeout on a
+    slow cold start) are never stored, so the next run simply probes again.
+    """
+    exe = shutil.which("backlog")
+    if exe is None:
+        return False
+    try:
+        key = f"{exe}:{os.stat(exe).st_mtime_ns}"
+    except OSError:
+        return False
+
+    try:
+        cached_key, _, probed_at = CLI_PROBE_CACHE.read_text(encoding="utf-8").partition("\n")
+        if cached_key == key and 0 <= time.time() - float(probed_at) < CLI_PROBE_TTL:
+            return True
+    except (OSError, ValueError):
+        pass
+
     try:
         result = subprocess.run(["backlog", "--version"], capture_output=True, text=True, timeout=5)
-        return result.returncode == 0
     except (FileNotFoundError, subprocess.TimeoutExpired):
         return False
+    if result.returncode != 0:
+        return False
+
+    try:
+        CLI_PROBE_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        CLI_PROBE_CACHE.write_text(f"{key}\n{time.time()}\n", encoding="utf-8")
+    except OSError:
+        pass
+    return True
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_cached(raw: str, note_path: str) -> dict:
+    return parse_action_item(raw, note_path)
+
+
+def parse_item(raw: str, note_path: str) -> dict:
+    """parse_action_item, memoized on (raw, note_path) for repeated/duplicate items.
+
+    Returns a fresh copy each time so callers can't mutate the cached result.
+    """
+    fields = dict(_parse_cached(raw, note_path))
+    fields["labels"] = list(fields["labels"])
+    fields["dependencies"] = list(fields["dependencies"])
+    return fields
 
 
 def create_backlog_task(title: str, assignee: str, due_date: str | None,
-                        labels: list, source: str, dry_run: bool) -> bool:
+                        labels: list, source: str, dry_run: bool, out: list[str]) -> bool:
     """Create a task using the backlog CLI (v1.x API).
 
     backlog task create <title> [options]
     - title is a positional arg (not --title)
     - labels are comma-separated via -l
     - no native --due flag; due date goes in description
+
+    Progress lines are appended to `out` rather than printed.
     """
     description_parts = [f"Extracted from {source}"]
     if due_date and due_date not in ("null", None, ""):
@@ -67,29 +126,29 @@ def create_backlog_task(title: str, assignee: str, due_date: str | None,
         cmd += ["--labels", ",".join(labels)]
 
     if dry_run:
-        print(f"  [DRY RUN] Would run: {' '.join(cmd)}")
+        out.append(f"  [DRY RUN] Would run: {' '.join(cmd)}")
         return True
 
     result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(IMPL_DIR))
     if result.returncode != 0:
-        print(f"  Error: {result.stderr.strip()}")
+        out.append(f"  Error: {result.stderr.strip()}")
         return False
-    print(f"  Created: {result.stdout.strip()}")
+    out.append(f"  Created: {result.stdout.strip()}")
     return True
 
 
 def write_backlog_md_directly(title: str, assignee: str, due_date: str | None,
-                               labels: list, source: str, task_num: int, dry_run: bool):
-    """Fallback: write Backlog.md format directly if CLI is unavailable."""
-    BACKLOG_DIR.mkdir(parents=True, exist_ok=True)
-    tasks_dir = BACKLOG_DIR / "tasks"
-    tasks_dir.mkdir(exist_ok=True)
+                               labels: list, source: str, task_num: int, dry_run: bool,
+                               out: list[str], today: str):
+    """Fallback: write Backlog.md format directly if CLI is unavailable.
 
-    today = date.today().isoformat()
+    Progress lines are appended to `out` rather than printed.
+    """
+    tasks_dir = BACKLOG_DIR / "tasks"
     labels_str = ", ".join(labels) if labels else ""
     due_str = str(due_date) if due_date and due_date not in ("null", None) else ""
 
-    content = f"""---
+    frontmatter = f"""---
 title: "{title}"
 status: todo
 assignee: "{assignee}"
@@ -103,7 +162,8 @@ effort: null
 source: "{source}"
 ---
 
-# {title}
+"""
+    body = f"""# {title}
 
 > Imported from {source} on {today}
 
@@ -118,12 +178,12 @@ source: "{source}"
     path = tasks_dir / filename
 
     if dry_run:
-        print(f"  [DRY RUN] Would write: {path}")
-        print(f"  Title: {title}")
-        print(f"  Assignee: {assignee} | Due: {due_str} | Labels: {labels_str}")
+        out.append(f"  [DRY RUN] Would write: {path}")
+        out.append(f"  Title: {title}")
+        out.append(f"  Assignee: {assignee} | Due: {due_str} | Labels: {labels_str}")
     else:
-        path.write_text(content, encoding="utf-8")
-        print(f"  Written: {path}")
+        write_parts(path, [frontmatter.encode("utf-8"), body.encode("utf-8")])
+        out.append(f"  Written: {path}")
 
 
 def main():
@@ -158,42 +218,55 @@ def main():
     existing_tasks = list(BACKLOG_DIR.glob("tasks/task-*.md")) if BACKLOG_DIR.exists() else []
     task_num = len(existing_tasks) + 1
 
-    for item in raw_items:
-        fields = parse_action_item(item["raw"], str(args.note))
-        source_stem = args.note.stem
-        source = f"[[{source_stem}]]"
-
-        print(f"\n→ {fields['title'][:60]}")
-        print(f"  confidence={fields['confidence']} assignee={fields['assignee']}")
-
-        if fields["confidence"] < 0.7:
-            print(f"  [SKIPPED — confidence < 0.7, review manually]")
-            flagged += 1
-            continue
-
-        if use_cli:
-            success = create_backlog_task(
-                title=fields["title"],
-                assignee=fields["assignee"],
-                due_date=fields["due_date"],
-                labels=fields["labels"],
-                source=source,
-                dry_run=args.dry_run,
-            )
-            if success:
+    if not use_cli and not args.dry_run:
+        (BACKLOG_DIR / "tasks").mkdir(parents=True, exist_ok=True)
+
+    # Per-item progress is collected and written once at the end (or on the way out,
+    # if a write fails part-way).
+    out: list[str] = []
+    source = f"[[{args.note.stem}]]"
+    today = date.today().isoformat()
+    try:
+        for item in raw_items:
+            fields = parse_item(item["raw"], str(args.note))
+
+            out.append(f"\n→ {fields['title'][:60]}")
+            out.append(f"  confidence={fields['confidence']} assignee={fields['assignee']}")
+
+            if fields["confidence"] < 0.7:
+                out.append(f"  [SKIPPED — confidence < 0.7, review manually]")
+                flagged += 1
+                continue
+
+            if use_cli:
+                success = create_backlog_task(
+                    title=fields["title"],
+                    assignee=fields["assignee"],
+                    due_date=fields["due_date"],
+                    labels=fields["labels"],
+                    source=source,
+                    dry_run=args.dry_run,
+                    out=out,
+                )
+                if success:
+                    written += 1
+            else:
+                write_backlog_md_directly(
+                    title=fields["title"],
+                    assignee=fields["assignee"],
+                    due_date=fields["due_date"],
+                    labels=fields["labels"],
+                    source=source,
+                    task_num=task_num,
+                    dry_run=args.dry_run,
+                    out=out,
+                    today=today,
+                )
                 written += 1
-        else:
-            write_backlog_md_directly(
-                title=fields["title"],
-                assignee=fields["assignee"],
-                due_date=fields["due_date"],
-                labels=fields["labels"],
-                source=source,
-                task_num=task_num,
-                dry_run=args.dry_run,
-            )
-            written += 1
-            task_num += 1
+                task_num += 1
+    finally:
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
 
     print(f"\nDone: {written} imported, {flagged} skipped (low confidence)")
     if not args.dry_run and written:
@@ -13,6 +13,7 @@ Usage:
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -24,8 +25,9 @@ sys.path.insert(0, str(REPO_ROOT / "scripts"))
 try:
     from score_tasks import (
         compute_urgency, heuristic_impact_effort, compute_score,
-        parse_frontmatter, render_frontmatter, llm_score_impact_effort
+        parse_frontmatter, llm_score_impact_effort_batch, needs_llm, write_task_frontmatter
     )
+    from task_io import list_task_files, read_frontmatter_heads
     HAS_SCORER = True
 except ImportError:
     HAS_SCORER = False
@@ -51,7 +53,7 @@ def main():
         print("Run: python importer.py ../../meeting-notes/<file>.md")
         sys.exit(0)
 
-    task_files = sorted(BACKLOG_DIR.glob("*.md"))
+    task_files = list_task_files(BACKLOG_DIR, prefix="")  # str paths; no Path per file
     if not task_files:
         print("No task files found.")
         sys.exit(0)
@@ -59,24 +61,34 @@ def main():
     print(f"Found {len(task_files)} task(s) in {BACKLOG_DIR}\n")
 
     results = []
+    unchanged = 0
     from datetime import date
-    today = date.today().isoformat()
-
-    for path in task_files:
-        text = path.read_text(encoding="utf-8")
-        fm, body = parse_frontmatter(text)
+    today = date.today()
+
+    # Parse everything first so tasks needing the LLM go out in batched requests.
+    # Scoring here only looks at frontmatter, so the body is never read unless a
+    # rewrite changes the frontmatter size.
+    heads = zip(task_files, read_frontmatter_heads(task_files))
+    parsed = [(path, parse_frontmatter(head, need_body=False)[0], head) for path, head in heads]
+    llm_results = {}
+    if not args.no_llm:
+        to_llm = [(path, fm) for path, fm, _ in parsed if fm and needs_llm(fm)]
+        batch = llm_score_impact_effort_batch([(fm, "") for _, fm in to_llm])
+        llm_results = {path: r for (path, _), r in zip(to_llm, batch)}
+
+    for path, fm, head in parsed:
+        name = os.path.basename(path)
         if not fm:
-            print(f"  SKIP {path.name}: no frontmatter")
+            print(f"  SKIP {name}: no frontmatter")
             continue
 
-        urgency = compute_urgency(fm)
+        urgency = compute_urgency(fm, today=today)
         impact = fm.get("impact")
         effort = fm.get("effort")
 
-        if (impact is None or effort is None) and not args.no_llm:
-            llm_result = llm_score_impact_effort(fm)
-            if llm_result:
-                impact, effort = llm_result
+        llm_result = llm_results.get(path)
+        if (impact is None or effort is None) and llm_result:
+            impact, effort = llm_result
 
         if impact is None or effort is None:
             impact_h, effort_h = heuristic_impact_effort(fm)
@@ -85,33 +97,37 @@ def main():
 
         score = compute_score(urgency, impact, effort)
 
-        title = fm.get("title", path.stem)
-        action = "Would set" if args.dry_run else "Scored"
-        print(f"  {action} {path.name}: score={score} "
+        title = fm["title"] if "title" in fm else name[:-3]  # list_task_files: *.md only
+        stored = (fm.get("urgency"), fm.get("impact"), fm.get("effort"), fm.get("score"))
+        is_unchanged = not args.dry_run and stored == (urgency, impact, effort, score)
+        action = "Would set" if args.dry_run else "Unchanged" if is_unchanged else "Scored"
+        print(f"  {action} {name}: score={score} "
               f"(u={urgency} i={impact} e={effort}) — {str(title)[:40]}")
 
-        results.append({"path": path, "fm": fm, "body": body,
+        results.append({"path": path, "name": name, "fm": fm,
                         "score": score, "urgency": urgency,
                         "impact": impact, "effort": effort, "title": title})
 
-        if not args.dry_run:
+        if is_unchanged:
+            unchanged += 1
+        elif not args.dry_run:
             fm["score"] = score
             fm["urgency"] = urgency
             fm["impact"] = impact
             fm["effort"] = effort
-            fm["updated"] = today
-            content = f"---\n{render_frontmatter(fm)}\n---\n\n{body}"
-            path.write_text(content, encoding="utf-8")
+            fm["updated"] = today.isoformat()
+            write_task_frontmatter(path, fm, None, head)
 
     if args.list and results:
         results.sort(key=lambda r: r["score"], reverse=True)
         print(f"\n{'─'*60}")
         print("  Priority ranking:")
         for r in results:
-            print(f"  {r['score']:4.1f}  {r['path'].name}  {str(r['title'])[:45]}")
+            print(f"  {r['score']:4.1f}  {r['name']}  {str(r['title'])[:45]}")
 
     print(f"\n{'─'*60}")
-    print(f"  {len(results)} task(s) scored")
+    print(f"  {len(results)} task(s) scored"
+          + (f" ({unchanged} unchanged, not rewritten)" if unchanged else ""))
     if args.dry_run:
         print("  (dry run — no files written)")
 
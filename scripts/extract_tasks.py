@@ -15,6 +15,8 @@ import sys
 from datetime import date
 from pathlib import Path
 
+from task_io import keyword_matcher, scan_max_task_num, write_parts
+
 REPO_ROOT = Path(__file__).parent.parent
 PROMPTS_DIR = REPO_ROOT / "scripts" / "prompts"
 
@@ -35,6 +37,39 @@ URGENCY_KEYWORDS = {
     "high priority": 1, "soon": 1,
 }
 
+# Priority bucket by urgency (0-10)
+_PRIORITY_BY_URGENCY = tuple("high" if u >= 8 else "medium" if u >= 5 else "low"
+                             for u in range(11))
+
+# Substring → label; several substrings may map to the same label
+LABEL_KEYWORDS = (
+    ("auth", "auth"), ("api", "api"), ("db", "database"), ("database", "database"),
+    ("test", "testing"), ("deploy", "deploy"), ("bug", "bug"), ("fix", "bug"),
+    ("doc", "docs"), ("design", "design"), ("front", "frontend"), ("back", "backend"),
+    ("infra", "infrastructure"),
+)
+
+_keyword_hits = keyword_matcher({*URGENCY_KEYWORDS, *(kw for kw, _ in LABEL_KEYWORDS)})
+
+# Compiled once at import; anchored on a literal "\n" so the regex engine can skip ahead
+# to line starts. _WS is whitespace that doesn't end a line, so a match can't run across
+# lines the way \s would (extract_action_items normalizes every line break to "\n").
+_WS = r"[^\S\n]"
+_SECTION_START_RE = re.compile(rf"\n##{_WS}+(?i:Action Items)")
+_SECTION_END_RE = re.compile(rf"\n##{_WS}+(?!{_WS}|(?i:Action Items))")
+_ITEM_RE = re.compile(rf"\n{_WS}*-{_WS}+\[[ xX]\]{_WS}+(.+)$", re.MULTILINE)
+# Line breaks str.splitlines() honours besides "\n"
+_OTHER_EOLS = ("\r", "\v", "\f", "\x1c", "\x1d", "\x1e", "\x85", "\u2028", "\u2029")
+_OWNER_RE = re.compile(r"\*\*(@\w+)\*\*")
+_DUE_RE = re.compile(r"due\s+(\d{4}-\d{2}-\d{2}|next meeting|eod|today|[\w\s]+\d+)", re.IGNORECASE)
+# Same pattern for text that is already lowercased (no per-character case folding)
+_DUE_LOWER_RE = re.compile(_DUE_RE.pattern)
+# Title cleanup, applied in this order: owner tags, then the first "— due ..." clause,
+# then the first "— blocking|depends on|blocked ..." clause of what is left.
+_TITLE_OWNER_RE = re.compile(r"\*\*@\w+\*\*\s*[—-]\s*")
+_TITLE_DUE_RE = re.compile(r"\s*[—-]\s*due\s+.+", re.IGNORECASE)
+_TITLE_BLOCKING_RE = re.compile(r"\s*[—-]\s*(blocking|depends on|blocked)\s+.+", re.IGNORECASE)
+
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Extract tasks from a meeting note")
@@ -59,27 +94,19 @@ def extract_action_items(text: str) -> list[dict]:
     Expected format: `- [ ] **@owner** — description — due date`
     Returns list of raw action item dicts.
     """
-    items = []
-    in_section = False
-
-    for line in text.splitlines():
-        if re.match(r"^##\s+Action Items", line, re.IGNORECASE):
-            in_section = True
-            continue
-        if in_section and re.match(r"^##\s+", line):
-            break
-        if not in_section:
-            continue
-
-        # Match checkbox action items
-        m = re.match(r"^\s*-\s+\[[ x]\]\s+(.+)$", line, re.IGNORECASE)
-        if not m:
-            continue
-
-        raw = m.group(1).strip()
-        items.append({"raw": raw, "line": line.strip()})
+    if any(eol in text for eol in _OTHER_EOLS):
+        text = "\n".join(text.splitlines())  # CRLF, lone CR, form feeds ... become "\n"
 
-    return items
+    # Slice out the section (up to the next non-Action-Items heading) and scan only that,
+    # without splitting the whole note into lines.
+    text = "\n" + text
+    start = _SECTION_START_RE.search(text)
+    if not start:
+        return []
+    end = _SECTION_END_RE.search(text, start.end())
+    section = text[start.end():end.start() if end else len(text)]
+    return [{"raw": m.group(1).strip(), "line": m.group().strip()}
+            for m in _ITEM_RE.finditer(section)]
 
 
 def parse_action_item(raw: str, source_file: str) -> dict:
@@ -88,32 +115,27 @@ def parse_action_item(raw: str, source_file: str) -> dict:
     Heuristic parsing — LLM integration point for production use.
     """
     # Extract owner
-    owner_match = re.search(r"\*\*(@\w+)\*\*", raw)
+    owner_match = _OWNER_RE.search(raw)
     assignee = owner_match.group(1) if owner_match else "unassigned"
 
-    # Extract due date
-    due_match = re.search(
-        r"due\s+(\d{4}-\d{2}-\d{2}|next meeting|eod|today|[\w\s]+\d+)",
-        raw, re.IGNORECASE
-    )
-    due_date = due_match.group(1) if due_match else None
+    lower = raw.lower()
+
+    # Extract due date — matched on the lowercased text, value sliced from the original
+    if len(lower) == len(raw):
+        due_match = _DUE_LOWER_RE.search(lower)
+        due_date = raw[due_match.start(1):due_match.end(1)] if due_match else None
+    else:  # lower() changed the length (rare Unicode), so spans wouldn't line up
+        due_match = _DUE_RE.search(raw)
+        due_date = due_match.group(1) if due_match else None
 
     # Extract title (strip owner, due date, meta)
-    title = re.sub(r"\*\*@\w+\*\*\s*[—-]\s*", "", raw)
-    title = re.sub(r"\s*[—-]\s*due\s+.+", "", title, flags=re.IGNORECASE)
-    title = re.sub(r"\s*[—-]\s*(blocking|depends on|blocked)\s+.+", "", title, flags=re.IGNORECASE)
-    title = title.strip(" —-")
+    title = _TITLE_OWNER_RE.sub("", raw)
+    title = _TITLE_DUE_RE.sub("", title)
+    title = _TITLE_BLOCKING_RE.sub("", title).strip(" —-")
 
     # Detect labels from keywords
-    labels = []
-    lower = raw.lower()
-    for keyword, label in [("auth", "auth"), ("api", "api"), ("db", "database"),
-                            ("database", "database"), ("test", "testing"),
-                            ("deploy", "deploy"), ("bug", "bug"), ("fix", "bug"),
-                            ("doc", "docs"), ("design", "design"), ("front", "frontend"),
-                            ("back", "backend"), ("infra", "infrastructure")]:
-        if keyword in lower:
-            labels.append(label)
+    hits = _keyword_hits(lower)
+    labels = {label for keyword, label in LABEL_KEYWORDS if keyword in hits}
 
     # Compute confidence based on how much structured info we found
     confidence = 0.5
@@ -127,7 +149,7 @@ def parse_action_item(raw: str, source_file: str) -> dict:
     # Urgency from keywords — accumulate all matches
     urgency = 5
     for kw, boost in URGENCY_KEYWORDS.items():
-        if kw in lower:
+        if kw in hits:
             urgency = min(10, urgency + boost)
 
     source_stem = Path(source_file).stem
@@ -137,31 +159,19 @@ def parse_action_item(raw: str, source_file: str) -> dict:
         "title": title,
         "status": "todo",
         "assignee": assignee,
-        "priority": "high" if urgency >= 8 else "medium" if urgency >= 5 else "low",
+        "priority": _PRIORITY_BY_URGENCY[urgency],
         "urgency": urgency,
         "impact": None,   # requires LLM scoring
         "effort": None,   # requires LLM scoring
         "score": None,    # computed after LLM scoring
         "due_date": due_date,
-        "labels": list(set(labels)),
+        "labels": sorted(labels),  # sorted so reruns write identical files
         "dependencies": [],
         "source": wikilink,
         "confidence": round(confidence, 2),
     }
 
 
-def next_task_id(task_dir: Path) -> str:
-    existing = list(task_dir.glob("TASK-*.md")) + list(FLAGGED_DIR.glob("TASK-*.md"))
-    if not existing:
-        return "TASK-001"
-    nums = []
-    for f in existing:
-        m = re.match(r"TASK-(\d+)", f.stem)
-        if m:
-            nums.append(int(m.group(1)))
-    return f"TASK-{(max(nums) + 1):03d}" if nums else "TASK-001"
-
-
 def render_task_md(task_id: str, fields: dict, today: str) -> str:
     labels_yaml = json.dumps(fields.get("labels") or [])
     deps_yaml = json.dumps(fields.get("dependencies") or [])
@@ -212,7 +222,7 @@ def write_task(task_id: str, content: str, destination: Path, dry_run: bool) ->
         print(content)
     else:
         destination.mkdir(parents=True, exist_ok=True)
-        filepath.write_text(content, encoding="utf-8")
+        write_parts(filepath, [content.encode("utf-8")])
         print(f"  Written: {filepath}")
     return filepath
 
@@ -234,10 +244,13 @@ def main():
     print(f"Confidence threshold: {CONFIDENCE_THRESHOLD}")
 
     written, flagged_count = 0, 0
+    # Scan once up front; re-globbing both dirs per item made extraction O(N^2).
+    next_num = scan_max_task_num(task_dir, FLAGGED_DIR) + 1
 
     for item in raw_items:
         fields = parse_action_item(item["raw"], str(args.note))
-        task_id = next_task_id(task_dir)
+        task_id = f"TASK-{next_num:03d}"
+        next_num += 1
         content = render_task_md(task_id, fields, today)
 
         if fields["confidence"] < CONFIDENCE_THRESHOLD:
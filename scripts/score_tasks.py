@@ -16,16 +16,27 @@ Usage:
 """
 
 import argparse
+import functools
+import hashlib
+import heapq
+import json
 import os
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from pathlib import Path
+from xml.sax.saxutils import escape as _xml_escape
 
 try:
-    import yaml
-    HAS_YAML = True
-except ImportError:  # pragma: no cover
-    HAS_YAML = False
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from task_io import (HAS_LIBYAML, HAS_YAML, keyword_matcher, list_task_files, load_yaml,
+                     overwrite_head, pmap, read_frontmatter_head, render_task_frontmatter,
+                     write_parts)
 
 REPO_ROOT = Path(__file__).parent.parent
 PROMPTS_DIR = REPO_ROOT / "scripts" / "prompts"
@@ -44,97 +55,148 @@ URGENCY_KEYWORDS = {
 
 SCORE_WEIGHTS = {"urgency": 0.4, "impact": 0.4, "effort": -0.2}
 
+# orjson only parses; task_io renders frontmatter lists with json.dumps' default format.
+_jloads = orjson.loads if HAS_ORJSON else json.loads  # type: ignore[possibly-undefined]
+
+LLM_MODEL = "claude-haiku-4-5-20251001"
+# Tasks per batched LLM request; keeps the JSON reply well inside max_tokens.
+LLM_BATCH_SIZE = 20
+# Concurrent LLM batch requests; more mostly buys rate-limit errors.
+LLM_MAX_WORKERS = 8
+# Below this many task files a thread pool costs more than the I/O it overlaps.
+PARALLEL_MIN_TASKS = 8
+# LLM impact/effort results by task content, so reruns don't rescore unchanged tasks.
+SCORE_CACHE_PATH = REPO_ROOT / "scripts" / ".score_cache.json"
+SCORE_CACHE_MAX = 1_000_000
+_SCORE_CACHE_VERSION = 1
 
-def parse_args():
+
+def parse_args(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(description="Score tasks using multi-factor engine")
     parser.add_argument("--impl", choices=["A", "B", "C"], help="Score only one implementation")
     parser.add_argument("--dry-run", action="store_true", help="Preview scores without writing")
     parser.add_argument("--no-llm", action="store_true", help="Rule-based scoring only, no LLM")
-    return parser.parse_args()
+    parser.add_argument("--llm-batch-size", type=int, default=LLM_BATCH_SIZE, metavar="N",
+                        help=f"Tasks per LLM request (default: {LLM_BATCH_SIZE})")
+    return parser.parse_args(argv)
+
 
+def parse_frontmatter(text: str, need_body: bool = True) -> tuple[dict, str | None]:
+    """Extract YAML frontmatter and body from markdown.
 
-def parse_frontmatter(text: str) -> tuple[dict, str]:
-    """Extract YAML frontmatter and body from markdown."""
+    With need_body=False the body is never sliced out of text and None is returned in
+    its place (for callers that only look at the frontmatter).
+    """
     if not text.startswith("---"):
-        return {}, text
+        return {}, text if need_body else None
 
     end = text.find("\n---", 3)
     if end == -1:
-        return {}, text
+        return {}, text if need_body else None
 
     fm_text = text[3:end].strip()
-    body = text[end + 4:].strip()
-
-    if HAS_YAML:
-        try:
-            fm = yaml.safe_load(fm_text) or {}  # type: ignore[possibly-undefined]
-        except yaml.YAMLError:  # type: ignore[possibly-undefined]
-            fm = _minimal_yaml_parse(fm_text)
-    else:
+    body = text[end + 4:].strip() if need_body else None
+
+    # Task frontmatter is flat key: scalar lines, which the line parser reads exactly as
+    # YAML would; PyYAML only runs for anything it can't vouch for.
+    fm = _flat_parse(fm_text)
+    if fm is None and HAS_YAML:
+        fm = load_yaml(fm_text)
+    if fm is None:
         fm = _minimal_yaml_parse(fm_text)
 
     return fm, body
 
 
+_FM_LINE_RE = re.compile(r'^(\w[\w_-]*):\s*(.*)$')
+_INT_RE = re.compile(r'-?\d+')
+_FLOAT_RE = re.compile(r'-?\d+\.\d+')
+# Scalar coercions tried in order after the null check; first full match wins.
+_COERCERS = ((_FLOAT_RE, float), (_INT_RE, int))
+_NULL_WORDS = frozenset(("null", "~", ""))
+# Lines whose value YAML and _minimal_yaml_parse agree on: null, plain decimal numbers
+# (no leading zeros, which YAML reads as octal), quoted strings without escapes that
+# don't look like arrays or begin/end with a quote, JSON arrays, and plain text
+# without YAML indicators.
+_FLAT_LINE_RE = re.compile(
+    r"""^\w[\w-]*:(?:[ ]+(?:null|Null|NULL|~|-?(?:0|[1-9]\d*)(?:\.\d+)?"""
+    r"""|"(?:[^"\\'][^"\\]*)?(?<!')"|'(?:[^'"][^']*)?(?<!")'|\[.*\]"""
+    r"""|[A-Za-z@][^:#"'\[\]{}]*))?[ ]*$"""
+)
+_YAML_BOOLS = frozenset({"yes", "no", "true", "false", "on", "off"})
+_YAML_NULLS = frozenset({"null", "Null", "NULL"})
+_EXPONENT_RE = re.compile(r"\d[eE]")
+
+
+def _flat_parse(fm_text: str) -> dict | None:
+    """
+    Parse frontmatter made only of simple `key: value` lines; None if any line needs a
+    real YAML parser (nesting, lists, comments, bools, dates, escapes...).
+    """
+    fm: dict = {}
+    for line in fm_text.splitlines():
+        if not line.strip():
+            continue
+        if not _FLAT_LINE_RE.match(line):
+            return None
+        key, raw = _FM_LINE_RE.match(line).groups()  # type: ignore[union-attr]
+        raw = raw.strip()
+        lower = raw.lower()
+        if lower in _YAML_BOOLS or (lower == "null" and raw not in _YAML_NULLS):
+            return None
+        val = _coerce_value(raw)
+        if raw.startswith("["):
+            # YAML reads 1e5 as a string and has its own escapes; let it decide those.
+            if not isinstance(val, list) or "\\" in raw or _EXPONENT_RE.search(raw):
+                return None
+        elif isinstance(val, list):
+            return None  # quoted JSON array: YAML keeps it as a string
+        fm[key] = val
+    return fm
+
+
 def _minimal_yaml_parse(fm_text: str) -> dict:
     """Minimal YAML parser for key: value pairs; handles JSON-array strings."""
-    import json as _json
     fm: dict = {}
     for line in fm_text.splitlines():
-        m = re.match(r'^(\w[\w_-]*):\s*(.*)$', line)
+        m = _FM_LINE_RE.match(line)
         if not m:
             continue
-        key = m.group(1)
-        raw = m.group(2).strip()
-        # JSON array value (may or may not be quoted)
-        inner = raw.strip('"\'')
-        if inner.startswith("[") and inner.endswith("]"):
-            try:
-                fm[key] = _json.loads(inner)
-                continue
-            except ValueError:
-                pass
-        if raw.lower() in ("null", "~", ""):
-            fm[key] = None
-        elif re.match(r'^-?\d+\.\d+$', raw):
-            fm[key] = float(raw)
-        elif re.match(r'^-?\d+$', raw):
-            fm[key] = int(raw)
-        else:
-            fm[key] = raw.strip('"\'')
+        fm[m.group(1)] = _coerce_value(m.group(2).strip())
     return fm
 
 
-def render_frontmatter(fm: dict) -> str:
-    """Render frontmatter dict back to YAML string."""
-    import json as _json
-    lines = []
-    for key, val in fm.items():
-        if val is None:
-            lines.append(f"{key}: null")
-        elif isinstance(val, list):
-            lines.append(f"{key}: {_json.dumps(val)}")
-        elif isinstance(val, str):
-            # Guard: if a string looks like a JSON array (corrupted round-trip),
-            # parse it back to a list and emit properly.
-            stripped = val.strip()
-            if stripped.startswith("[") and stripped.endswith("]"):
-                try:
-                    parsed = _json.loads(stripped)
-                    if isinstance(parsed, list):
-                        lines.append(f"{key}: {_json.dumps(parsed)}")
-                        continue
-                except ValueError:
-                    pass
-            lines.append(f'{key}: "{val}"')
-        elif isinstance(val, float):
-            lines.append(f"{key}: {val:.1f}")
-        else:
-            lines.append(f"{key}: {val}")
-    return "\n".join(lines)
+def _coerce_value(raw: str):
+    # JSON array value (may or may not be quoted)
+    inner = raw.strip('"\'')
+    if inner.startswith("[") and inner.endswith("]"):
+        try:
+            return _jloads(inner)
+        except ValueError:
+            pass
+    if raw.lower() in _NULL_WORDS:
+        return None
+    for pattern, convert in _COERCERS:
+        if pattern.fullmatch(raw):
+            return convert(raw)
+    return inner
+
+
+def _parse_due(due) -> date:
+    """Parse a YYYY-MM-DD due date; raises ValueError otherwise."""
+    return _parse_due_text(str(due))
 
 
-def compute_urgency(fm: dict, body: str = "") -> int:
+@functools.lru_cache(maxsize=1024)
+def _parse_due_text(text: str) -> date:
+    """_parse_due on the str form; tasks tend to share a handful of due dates."""
+    if len(text) == 10 and text[4] == text[7] == "-":
+        return date.fromisoformat(text)  # C fast path for the canonical form
+    # Anything else (e.g. unpadded 2026-3-5) keeps strptime's exact rules
+    return datetime.strptime(text, "%Y-%m-%d").date()
+
+
+def compute_urgency(fm: dict, body: str = "", today: date | None = None) -> int:
     """Rule-based urgency: keyword detection + deadline proximity.
 
     Uses extracted urgency from frontmatter as the keyword baseline (set during
@@ -153,16 +215,17 @@ def compute_urgency(fm: dict, body: str = "") -> int:
             str(fm.get("title", "")),
             body,
         ]).lower()
-        for kw, boost in URGENCY_KEYWORDS.items():
-            if kw in searchable:
-                score = min(10, score + boost)
+        hits = _urgency_hits(searchable)
+        if hits:
+            # Boosts are all positive, so clamping once equals clamping after each one.
+            score = min(10, score + sum(URGENCY_KEYWORDS[kw] for kw in hits))
 
     # Always apply deadline proximity — this was the bug.
     due = fm.get("due_date")
     if due and due not in ("null", None, ""):
         try:
-            due_date = datetime.strptime(str(due), "%Y-%m-%d").date()
-            days_left = (due_date - date.today()).days
+            due_date = _parse_due(due)
+            days_left = (due_date - (today or date.today())).days
             if days_left <= 0:
                 score = min(10, score + 4)
             elif days_left <= 2:
@@ -177,14 +240,29 @@ def compute_urgency(fm: dict, body: str = "") -> int:
     return min(10, score)
 
 
+# Title keywords for the heuristic fallback
+HIGH_IMPACT_KEYWORDS = ("launch", "release", "customer", "revenue", "security", "auth",
+                        "production", "deploy", "outage", "critical", "blocking")
+HARD_KEYWORDS = ("refactor", "migrate", "redesign", "architecture", "integration",
+                 "rewrite", "research", "spike")
+EASY_KEYWORDS = ("fix typo", "update readme", "update doc", "bump version", "hotfix")
+
+_urgency_hits = keyword_matcher(URGENCY_KEYWORDS)
+_heuristic_hits = keyword_matcher({*HIGH_IMPACT_KEYWORDS, *HARD_KEYWORDS, *EASY_KEYWORDS})
+
+
 def heuristic_impact_effort(fm: dict) -> tuple[int, int]:
     """
     Heuristic fallback when LLM is unavailable.
     Returns (impact, effort) as integers 1-10.
     """
-    title_lower = str(fm.get("title", "")).lower()
-    priority = str(fm.get("priority", "medium")).lower()
+    return _heuristic_impact_effort_cached(str(fm.get("priority", "medium")).lower(),
+                                           str(fm.get("title", "")).lower())
+
 
+@functools.lru_cache(maxsize=4096)
+def _heuristic_impact_effort_cached(priority: str, title_lower: str) -> tuple[int, int]:
+    """heuristic_impact_effort on (priority, lowercased title); rescoring repeats both."""
     # Impact heuristics
     impact = 6  # base
     if priority == "critical":
@@ -194,61 +272,92 @@ def heuristic_impact_effort(fm: dict) -> tuple[int, int]:
     elif priority == "low":
         impact = 3
 
-    high_impact_keywords = ["launch", "release", "customer", "revenue", "security", "auth",
-                            "production", "deploy", "outage", "critical", "blocking"]
-    for kw in high_impact_keywords:
-        if kw in title_lower:
-            impact = min(10, impact + 1)
+    hits = _heuristic_hits(title_lower)
+    impact = min(10, impact + len(hits.intersection(HIGH_IMPACT_KEYWORDS)))
 
-    # Effort heuristics
+    # Effort heuristics: every hard keyword is applied (capped at 10) before the easy ones
+    # (floored at 1), the order the per-keyword loops used.
     effort = 4  # base (medium)
-    hard_keywords = ["refactor", "migrate", "redesign", "architecture", "integration",
-                     "rewrite", "research", "spike"]
-    easy_keywords = ["fix typo", "update readme", "update doc", "bump version", "hotfix"]
-
-    for kw in hard_keywords:
-        if kw in title_lower:
-            effort = min(10, effort + 2)
-    for kw in easy_keywords:
-        if kw in title_lower:
-            effort = max(1, effort - 2)
+    effort = min(10, effort + 2 * len(hits.intersection(HARD_KEYWORDS)))
+    effort = max(1, effort - 2 * len(hits.intersection(EASY_KEYWORDS)))
 
     return impact, effort
 
 
-def llm_score_impact_effort(fm: dict, body: str = "") -> tuple[int, int] | None:
-    """
-    Score impact and effort via Anthropic claude-haiku-4-5.
-    Returns (impact, effort) or None if unavailable.
-    """
-    import json as _json
+# JSON array embedded in an LLM reply
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
 
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key:
-        return None
 
-    try:
-        import anthropic
-    except ImportError:
-        print("  [anthropic not installed — pip install anthropic]")
-        return None
+@functools.lru_cache(maxsize=1)
+def _rubrics() -> tuple[str, str]:
+    """(impact_rubric, effort_rubric) — read once per process."""
+    return ((PROMPTS_DIR / "impact_rubric.md").read_text(),
+            (PROMPTS_DIR / "effort_rubric.md").read_text())
 
-    impact_rubric = (PROMPTS_DIR / "impact_rubric.md").read_text()
-    effort_rubric = (PROMPTS_DIR / "effort_rubric.md").read_text()
 
-    title = fm.get("title", "")
+@functools.lru_cache(maxsize=1)
+def _anthropic_client(api_key: str):
+    """One client per process so its HTTP connection pool is reused across tasks."""
+    import anthropic
+    return anthropic.Anthropic(api_key=api_key)
+
+
+def _task_fields_xml(fm: dict, body: str) -> str:
+    """The fields of one task as sent to the LLM (the inside of a <task> element)."""
     labels = fm.get("labels") or []
-    due_date = fm.get("due_date") or "none"
-    source = fm.get("source") or "unknown"
     context = body[:600].strip() if body else "none"
+    return f"""<title>{_xml_escape(str(fm.get("title", "")))}</title>
+<labels>{_xml_escape(", ".join(map(str, labels)) if labels else "none")}</labels>
+<due_date>{_xml_escape(str(fm.get("due_date") or "none"))}</due_date>
+<source>{_xml_escape(str(fm.get("source") or "unknown"))}</source>
+<context>{_xml_escape(context)}</context>"""
+
+
+def _score_cache_key(task_xml: str) -> str:
+    return hashlib.sha1(task_xml.encode("utf-8")).hexdigest()
+
+
+def _score_cache_tag() -> str:
+    """Model plus a digest of the rubric prompt: changing either invalidates the cache."""
+    digest = hashlib.sha1(_batch_system_prompt().encode("utf-8")).hexdigest()[:16]
+    return f"{LLM_MODEL}:{digest}"
 
-    prompt = f"""Score the following task for impact and effort. Be precise — use the full 1–10 range.
 
-Task title: {title}
-Labels: {", ".join(labels) if labels else "none"}
-Due date: {due_date}
-Source: {source}
-Body context: {context}
+@functools.lru_cache(maxsize=1)
+def _score_cache() -> OrderedDict:
+    """SCORE_CACHE_PATH entries (sha1 of task fields → [impact, effort]), oldest first."""
+    try:
+        with open(SCORE_CACHE_PATH, "rb") as f:
+            data = _jloads(f.read())
+    except (OSError, ValueError):
+        return OrderedDict()
+    if (not isinstance(data, dict) or data.get("version") != _SCORE_CACHE_VERSION
+            or data.get("tag") != _score_cache_tag()
+            or not isinstance(data.get("entries"), dict)):
+        return OrderedDict()
+    return OrderedDict(data["entries"])
+
+
+def _save_score_cache() -> None:
+    cache = _score_cache()
+    while len(cache) > SCORE_CACHE_MAX:
+        cache.popitem(last=False)  # evict the least recently used
+    data = {"version": _SCORE_CACHE_VERSION, "tag": _score_cache_tag(), "entries": cache}
+    try:
+        raw = orjson.dumps(data) if HAS_ORJSON else json.dumps(data).encode("utf-8")  # type: ignore[possibly-undefined]
+        write_parts(SCORE_CACHE_PATH, [raw])
+    except OSError:
+        pass  # best-effort, like the frontmatter cache
+
+
+@functools.lru_cache(maxsize=1)
+def _batch_system_prompt() -> str:
+    """Instructions and rubrics shared by every batch request, built once so the text is
+    byte-identical across requests (a prerequisite for prompt caching)."""
+    impact_rubric, effort_rubric = _rubrics()
+    return f"""You score tasks for impact and effort. Be precise — use the full 1–10 range.
+
+Each user message lists tasks as <task index="N"> elements.
 
 ---
 {impact_rubric}
@@ -257,61 +366,201 @@ Body context: {context}
 {effort_rubric}
 
 ---
-Return ONLY a JSON object, no other text:
-{{"impact": <integer 1-10>, "effort": <integer 1-10>, "impact_rationale": "<one sentence>", "effort_rationale": "<one sentence>"}}"""
+Return ONLY a JSON array with one object per task, no other text:
+[{{"i": <task index>, "impact": <integer 1-10>, "effort": <integer 1-10>}}, ...]"""
+
+
+def llm_score_impact_effort_batch(items: list[tuple[dict, str]],
+                                  batch_size: int = LLM_BATCH_SIZE) -> list[tuple[int, int] | None]:
+    """
+    Score many (frontmatter, body) pairs with one request per batch_size tasks.
+    Returns one (impact, effort) or None per item, in input order.
+    """
+    results: list[tuple[int, int] | None] = [None] * len(items)
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key or not items:
+        return results
+
+    # Tasks whose fields were scored before (same model and rubrics) come from the cache.
+    cache = _score_cache()
+    task_xml = [_task_fields_xml(fm, body) for fm, body in items]
+    keys = [_score_cache_key(x) for x in task_xml]
+    pending = []
+    for idx, key in enumerate(keys):
+        cached = cache.get(key)
+        if cached:
+            results[idx] = (cached[0], cached[1])
+            cache.move_to_end(key)
+        else:
+            pending.append(idx)
+    if len(pending) < len(items):
+        print(f"  [LLM] {len(items) - len(pending)} task(s) from score cache")
+    if not pending:
+        return results
 
     try:
-        client = anthropic.Anthropic(api_key=api_key)
-        message = client.messages.create(
-            model="claude-haiku-4-5-20251001",
-            max_tokens=256,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        block = message.content[0]
-        if not hasattr(block, "text"):
-            return None
-        text = block.text.strip()  # type: ignore[union-attr]
-        m = re.search(r"\{.*\}", text, re.DOTALL)
-        if not m:
-            return None
-        data = _json.loads(m.group())
-        impact = max(1, min(10, int(data["impact"])))
-        effort = max(1, min(10, int(data["effort"])))
-        impact_r = data.get("impact_rationale", "")
-        effort_r = data.get("effort_rationale", "")
-        print(f"  [LLM] impact={impact} ({impact_r[:60]})")
-        print(f"  [LLM] effort={effort} ({effort_r[:60]})")
-        return impact, effort
-    except Exception as e:
-        print(f"  [LLM error: {e}]")
-        return None
+        import anthropic  # noqa: F401
+    except ImportError:
+        print("  [anthropic not installed — pip install anthropic]")
+        return results
+
+    client = _anthropic_client(api_key)
+    # The rubrics live in the system prompt, marked cacheable, so every batch after the
+    # first reads them from the prompt cache instead of paying for them again.
+    system = [{"type": "text", "text": _batch_system_prompt(),
+               "cache_control": {"type": "ephemeral"}}]
+    batch_size = max(1, batch_size)
+
+    def _score_batch(batch: list[int]) -> str | None:
+        """Fill results for the item indices in batch; returns the progress line, if any."""
+        tasks_text = "\n".join(f'<task index="{i}">\n{task_xml[idx]}\n</task>'
+                               for i, idx in enumerate(batch, 1))
+
+        try:
+            message = client.messages.create(
+                model=LLM_MODEL,
+                max_tokens=64 + 40 * len(batch),
+                system=system,
+                messages=[{"role": "user",
+                           "content": f"Score these {len(batch)} tasks.\n\n{tasks_text}"}],
+            )
+            block = message.content[0]
+            if not hasattr(block, "text"):
+                return None
+            text = block.text.strip()  # type: ignore[union-attr]
+            m = _JSON_ARRAY_RE.search(text)
+            if not m:
+                return None
+            data = _jloads(m.group())
+        except Exception as e:
+            return f"  [LLM error: {e}]"
+
+        scored = 0
+        for entry in data if isinstance(data, list) else []:
+            try:
+                i = int(entry["i"])
+                if 1 <= i <= len(batch):
+                    results[batch[i - 1]] = (max(1, min(10, int(entry["impact"]))),
+                                             max(1, min(10, int(entry["effort"]))))
+                    scored += 1
+            except (KeyError, TypeError, ValueError):
+                continue
+        return f"  [LLM] scored {scored}/{len(batch)} task(s) in one request"
+
+    # Batches are independent network round-trips, so they run concurrently (bounded by
+    # LLM_MAX_WORKERS to stay inside provider rate limits); each batch writes only its own
+    # entries of results, and progress lines are printed in batch order afterwards.
+    batches = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+    if len(batches) > 1:
+        with ThreadPoolExecutor(max_workers=min(LLM_MAX_WORKERS, len(batches))) as ex:
+            lines = list(ex.map(_score_batch, batches))
+    else:
+        lines = [_score_batch(batch) for batch in batches]
+    for line in lines:
+        if line:
+            print(line)
+
+    new_entries = [idx for idx in pending if results[idx] is not None]
+    for idx in new_entries:
+        cache[keys[idx]] = list(results[idx])  # type: ignore[arg-type]
+    if new_entries:
+        _save_score_cache()
+
+    return results
+
+
+def needs_llm(fm: dict) -> bool:
+    return fm.get("impact") is None or fm.get("effort") is None
+
+
+# SCORE_WEIGHTS × 10, so integer scores are combined with integer arithmetic and a
+# single division.
+_W_URGENCY, _W_IMPACT, _W_EFFORT = (round(SCORE_WEIGHTS[k] * 10)
+                                    for k in ("urgency", "impact", "effort"))
 
 
 def compute_score(urgency: int, impact: int, effort: int) -> float:
-    return round(
-        urgency * SCORE_WEIGHTS["urgency"]
-        + impact * SCORE_WEIGHTS["impact"]
-        + effort * SCORE_WEIGHTS["effort"],
-        1
-    )
+    return round((_W_URGENCY * urgency + _W_IMPACT * impact + _W_EFFORT * effort) / 10, 1)
 
 
-def score_task_file(path: Path, dry_run: bool, no_llm: bool) -> dict:
-    text = path.read_text(encoding="utf-8")
-    fm, body = parse_frontmatter(text)
+def _uses_body(fm: dict, no_llm: bool) -> bool:
+    """Whether scoring fm looks at the task body (keyword urgency or LLM context)."""
+    stored = fm.get("urgency")
+    if not (isinstance(stored, int) and stored > 0):
+        return True
+    return not no_llm and needs_llm(fm) and bool(os.environ.get("ANTHROPIC_API_KEY"))
+
 
+def load_task(path: str | Path, no_llm: bool) -> tuple[dict, str | None, str]:
+    """
+    (frontmatter, body, head) for a task file. Only the frontmatter block is read unless
+    scoring needs the body; body is None when it wasn't read.
+    """
+    head = read_frontmatter_head(path)
+    fm, _ = parse_frontmatter(head, need_body=False)
+    if not fm or not _uses_body(fm, no_llm):
+        return fm, None, head
+    if "\r" in head:  # CRLF file: parse the newline-translated text, frontmatter included
+        with open(path, encoding="utf-8") as f:
+            fm, body = parse_frontmatter(f.read())
+        return fm, body, head
+    return fm, _read_body(path, head), head
+
+
+def _read_body(path: str | Path, head: str) -> str:
+    """
+    The body of a task file whose frontmatter block is `head`, as parse_frontmatter would
+    return it, without parsing the frontmatter a second time.
+    """
+    if "\r" in head:  # CRLF files: let text-mode newline translation line things up
+        with open(path, encoding="utf-8") as f:
+            return parse_frontmatter(f.read())[1]
+    with open(path, "rb") as f:
+        f.seek(len(head.encode("utf-8")))
+        body = f.read().decode("utf-8")
+    if "\r" in body:  # same newline translation text mode would have applied
+        body = body.replace("\r\n", "\n").replace("\r", "\n")
+    return body.strip()
+
+
+def write_task_frontmatter(path: str | Path, fm: dict, body: str | None, head: str) -> None:
+    """
+    Write fm back to path. If the new frontmatter block is the same size as the old one
+    (`head`), only those bytes are overwritten and the body is never touched; otherwise
+    the file is rewritten, reading the body first if it wasn't loaded.
+    """
+    new_head = f"---\n{render_task_frontmatter(fm)}\n---"
+    data = new_head.encode("utf-8")
+    if head and len(data) == len(head.encode("utf-8")):
+        overwrite_head(path, data)
+        return
+    if body is None:
+        if head:
+            body = _read_body(path, head)
+        else:
+            with open(path, encoding="utf-8") as f:
+                _, body = parse_frontmatter(f.read())
+    write_parts(path, [data, f"\n\n{body}".encode("utf-8")])
+
+
+def score_parsed_task(path: str | Path, fm: dict, body: str | None, dry_run: bool,
+                      llm_result: tuple[int, int] | None, head: str = "",
+                      today: date | None = None) -> dict:
+    """
+    Score an already-loaded task (see load_task); llm_result is a prefetched
+    (impact, effort) or None. `today` defaults to date.today().
+    """
+    today = today or date.today()
     if not fm:
         return {"path": path, "status": "skipped", "reason": "no frontmatter"}
 
-    urgency = compute_urgency(fm, body)
+    urgency = compute_urgency(fm, body or "", today)
 
     impact = fm.get("impact")
     effort = fm.get("effort")
 
-    if (impact is None or effort is None) and not no_llm:
-        llm_result = llm_score_impact_effort(fm, body)
-        if llm_result:
-            impact, effort = llm_result
+    if (impact is None or effort is None) and llm_result:
+        impact, effort = llm_result
 
     if impact is None or effort is None:
         impact_h, effort_h = heuristic_impact_effort(fm)
@@ -319,11 +568,9 @@ def score_task_file(path: Path, dry_run: bool, no_llm: bool) -> dict:
         effort = effort if effort is not None else effort_h
 
     score = compute_score(urgency, impact, effort)
-    today = date.today().isoformat()
-
     result = {
         "path": path,
-        "id": fm.get("id", path.stem),
+        "id": fm["id"] if "id" in fm else os.path.splitext(os.path.basename(path))[0],
         "title": fm.get("title", ""),
         "urgency": urgency,
         "impact": impact,
@@ -333,58 +580,107 @@ def score_task_file(path: Path, dry_run: bool, no_llm: bool) -> dict:
     }
 
     if not dry_run:
+        stored = (fm.get("urgency"), fm.get("impact"), fm.get("effort"), fm.get("score"))
+        if stored == (urgency, impact, effort, score):
+            result["status"] = "unchanged"  # nothing to write; leave the file (and mtime) alone
+            return result
         fm["urgency"] = urgency
         fm["impact"] = impact
         fm["effort"] = effort
         fm["score"] = score
-        fm["updated_date"] = today
-
-        new_text = f"---\n{render_frontmatter(fm)}\n---\n\n{body}"
-        path.write_text(new_text, encoding="utf-8")
+        fm["updated_date"] = today.isoformat()
+        write_task_frontmatter(path, fm, body, head)
 
     return result
 
 
-def main():
-    args = parse_args()
+def _top_by_score(results: list[dict], k: int) -> list[dict]:
+    """
+    The k highest-scoring results, highest first, ties in input order — the same list as
+    sorted(results, key=score, reverse=True)[:k] without sorting everything.
+    """
+    return heapq.nlargest(k, results, key=lambda r: r["score"])
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(argv)
+    # main() may run repeatedly in one process (the MCP server calls it in-process):
+    # re-read the rubrics and the score cache, which CLI runs may have changed since.
+    for cached in (_rubrics, _batch_system_prompt, _score_cache):
+        cached.cache_clear()
 
     if not HAS_YAML:
         print("Note: pyyaml not installed — using minimal YAML parser (pip install pyyaml for full support)")
+    elif not HAS_LIBYAML:
+        print("Note: pyyaml built without libyaml — frontmatter YAML parsing uses the slower pure-Python loader")
 
     impls = [args.impl] if args.impl else ["A", "B", "C"]
     all_results = []
+    today = date.today()
 
+    # Load every implementation first so the LLM batches of all of them go out together;
+    # the files of all implementations are read and parsed in one pool.
+    listed = []
     for impl in impls:
         task_dir = IMPL_TASK_DIRS[impl]
         if not task_dir.exists():
             continue
 
-        task_files = sorted(task_dir.glob("TASK-*.md"))
-        if not task_files:
-            continue
-
+        # Plain str paths throughout; no Path object per task file. Directory order is
+        # fine for loading and scoring; results are put in file-name order for output.
+        task_files = list_task_files(task_dir, sort=False)
+        if task_files:
+            listed.append((impl, task_dir, task_files))
+
+    all_parsed = pmap(lambda f: (f, *load_task(f, args.no_llm)),
+                      [f for *_, task_files in listed for f in task_files], PARALLEL_MIN_TASKS)
+    loaded = []
+    pos = 0
+    for impl, task_dir, task_files in listed:
+        loaded.append((impl, task_dir, task_files, all_parsed[pos:pos + len(task_files)]))
+        pos += len(task_files)
+
+    llm_results: dict[str, tuple[int, int] | None] = {}
+    if not args.no_llm:
+        to_llm = [(f, fm, body) for *_, parsed in loaded
+                  for f, fm, body, _ in parsed if fm and needs_llm(fm)]
+        to_llm.sort(key=lambda item: item[0])  # same batches (and prompts) on every run
+        batch = llm_score_impact_effort_batch([(fm, body or "") for _, fm, body in to_llm],
+                                              args.llm_batch_size)
+        llm_results = {f: r for (f, _, _), r in zip(to_llm, batch)}
+
+    def _score(item: tuple) -> dict:
+        path, fm, body, head = item
+        return score_parsed_task(path, fm, body, args.dry_run, llm_results.get(path), head,
+                                 today)
+
+    for impl, task_dir, task_files, parsed in loaded:
         print(f"\nImplementation {impl} — {len(task_files)} task(s) in {task_dir}")
 
-        for task_file in task_files:
-            result = score_task_file(task_file, args.dry_run, args.no_llm)
-            all_results.append(result)
+        scored = pmap(_score, parsed, PARALLEL_MIN_TASKS)
+        ordered = sorted(zip(task_files, scored), key=lambda pair: pair[0])
+        all_results.extend(result for _, result in ordered)
 
+        for task_file, result in ordered:
             if result["status"] == "skipped":
-                print(f"  SKIP {task_file.name}: {result['reason']}")
+                print(f"  SKIP {os.path.basename(task_file)}: {result['reason']}")
             else:
-                action = "Would set" if args.dry_run else "Scored"
+                action = ("Would set" if args.dry_run
+                          else "Unchanged" if result["status"] == "unchanged" else "Scored")
                 print(f"  {action} {result['id']}: score={result['score']} "
                       f"(u={result['urgency']} i={result['impact']} e={result['effort']}) "
                       f"— {str(result['title'])[:40]}")
 
-    scored = [r for r in all_results if r["status"] == "scored"]
+    scored = [r for r in all_results if r["status"] in ("scored", "unchanged")]
     if scored:
-        print(f"\nTotal: {len(scored)} task(s) scored")
+        unchanged = sum(1 for r in scored if r["status"] == "unchanged")
+        print(f"\nTotal: {len(scored)} task(s) scored"
+              + (f" ({unchanged} unchanged, not rewritten)" if unchanged else ""))
         if args.dry_run:
             print("(dry run — no files written)")
 
         # Show top 5
-        top = sorted(scored, key=lambda r: r["score"], reverse=True)[:5]
+        top = _top_by_score(scored, 5)
         if len(scored) > 1:
             print("\nTop priority tasks:")
             for r in top:
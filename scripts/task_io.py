@@ -0,0 +1,413 @@
+"""
+task_io.py — Shared task-file I/O and frontmatter rendering helpers
+
+Imported from scripts/ by extract_tasks.py and score_tasks.py, and by the implementation
+entry points (server.py, daily-brief.py, importer.py, scorer.py).
+"""
+
+import json
+import mmap
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Iterable
+
+try:
+    import yaml
+    # libyaml-backed loader/dumper when PyYAML was built with it; same results, ~10x faster.
+    HAS_LIBYAML = hasattr(yaml, "CSafeLoader")
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    _YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    HAS_YAML = True
+except ImportError:
+    HAS_YAML = HAS_LIBYAML = False
+
+try:
+    import ahocorasick  # pip install pyahocorasick (optional)
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+_FM_CACHE_VERSION = 3
+_FM_WINDOW = 8192
+# Files modified this recently are parsed but not cached: on filesystems with coarse
+# timestamps a same-size rewrite within the same tick would otherwise look unchanged.
+_FM_RACY_NS = 2_000_000_000
+# Below this many uncached files a thread pool costs more to start than it saves.
+_PARALLEL_READ_MIN = 16
+
+
+def pmap(fn, items: list, min_items: int = _PARALLEL_READ_MIN) -> list:
+    """list(map(fn, items)), run on a thread pool from min_items items on so their file
+    I/O overlaps. Results keep input order, so output stays deterministic."""
+    if len(items) < min_items:
+        return list(map(fn, items))
+    with ThreadPoolExecutor(max_workers=min(32, len(items))) as ex:
+        return list(ex.map(fn, items))
+
+
+def keyword_matcher(keywords: Iterable[str]) -> Callable[[str], set[str]]:
+    """
+    A function returning the keywords that occur in a text. With pyahocorasick one
+    automaton finds them all in a single pass instead of one substring scan per keyword.
+    """
+    keywords = frozenset(keywords)
+    if HAS_AHOCORASICK:
+        automaton = ahocorasick.Automaton()
+        for kw in keywords:
+            automaton.add_word(kw, kw)
+        automaton.make_automaton()
+        return lambda text: {kw for _, kw in automaton.iter(text)}
+    # Keywords match as substrings ("soon" in "sooner"), so a word-token set can't stand
+    # in for this; and one str.__contains__ per keyword measured 5-10x faster than a
+    # single overlapping-alternation regex over the same text.
+    return lambda text: {kw for kw in keywords if kw in text}
+
+
+def read_frontmatter_head(path: str | Path) -> str:
+    """
+    Return the start of a task file up to and including its closing `---` line.
+
+    The file is memory-mapped and only the first few KB are scanned for the closing
+    marker, so the body is neither read nor decoded; the rest of the mapping is searched
+    only when the frontmatter is larger than that window. Files without a complete
+    frontmatter block yield "".
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:3] != b"---":
+                return ""
+            end = mm.find(b"\n---", 3, _FM_WINDOW)
+            if end == -1:
+                end = mm.find(b"\n---", 3)
+            if end == -1:
+                return ""
+            return mm[:end + 4].decode("utf-8")
+
+
+def read_frontmatter_heads(paths: list[str]) -> list[str]:
+    """read_frontmatter_head for each path, in order; concurrently for larger batches."""
+    return pmap(read_frontmatter_head, paths)
+
+
+def _iter_task_entries(dirpath: str | Path) -> list[os.DirEntry]:
+    """
+    TASK-*.md entries in dirpath (empty if the directory does not exist); a prefix/suffix
+    check instead of glob's fnmatch.
+    """
+    try:
+        with os.scandir(dirpath) as it:
+            return [e for e in it if e.name.startswith("TASK-") and e.name.endswith(".md")]
+    except FileNotFoundError:
+        return []
+
+
+def scan_max_task_num(*dirs: str | Path) -> int:
+    """Highest NNN of the TASK-NNN.md files across dirs (0 if none), one scandir each."""
+    highest = 0
+    for d in dirs:
+        for entry in _iter_task_entries(d):
+            digits = entry.name[5:-3]  # "TASK-NNN.md" -> "NNN"
+            if digits.isdecimal():
+                highest = max(highest, int(digits))
+    return highest
+
+
+def list_task_files(dirpath: str | Path, prefix: str = "TASK-", suffix: str = ".md",
+                    sort: bool = True) -> list[str]:
+    """
+    Sorted paths (as str) of the files in dirpath named prefix*suffix.
+
+    Equivalent to sorted(dirpath.glob(f"{prefix}*{suffix}")) for regular files, but one
+    scandir pass with plain string checks and no Path objects. sort=False returns them in
+    directory order, for callers that only need a deterministic order for their output.
+    """
+    with os.scandir(dirpath) as it:
+        paths = [e.path for e in it
+                 if e.name.startswith(prefix) and e.name.endswith(suffix) and e.is_file()]
+    if sort:
+        paths.sort()
+    return paths
+
+
+def load_yaml(text: str):
+    """Parse frontmatter YAML with the safe loader; None if it isn't valid YAML.
+    Only call when HAS_YAML."""
+    try:
+        return yaml.load(text, Loader=_YamlLoader) or {}  # type: ignore[possibly-undefined]
+    except yaml.YAMLError:  # type: ignore[possibly-undefined]
+        return None
+
+
+def _tag_value(val):
+    """json.dumps default: dates (YAML timestamps) as tagged objects _untag_value restores."""
+    if isinstance(val, datetime):
+        return {"__datetime__": val.isoformat()}
+    if isinstance(val, date):
+        return {"__date__": val.isoformat()}
+    raise TypeError(f"{type(val).__name__} is not JSON serializable")
+
+
+def _untag_value(obj: dict):
+    if len(obj) == 1:
+        if "__date__" in obj:
+            return date.fromisoformat(obj["__date__"])
+        if "__datetime__" in obj:
+            return datetime.fromisoformat(obj["__datetime__"])
+    return obj
+
+
+def _round_trips(fm: dict) -> bool:
+    """Whether fm comes back from the JSON cache equal, with the same key and value types."""
+    try:
+        return json.loads(json.dumps(fm, default=_tag_value), object_hook=_untag_value) == fm
+    except (TypeError, ValueError):
+        return False
+
+
+def _load_fm_cache(cache_path: Path, tag: str) -> dict:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"), object_hook=_untag_value)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != _FM_CACHE_VERSION or data.get("tag") != tag:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_fm_cache(cache_path: Path, tag: str, entries: dict) -> None:
+    data = {"version": _FM_CACHE_VERSION, "tag": tag, "entries": entries}
+    tmp = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp.write_text(json.dumps(data, default=_tag_value), encoding="utf-8")
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass  # cache is best-effort; a read-only task dir just means no caching
+
+
+def _stat_key(st: os.stat_result) -> list[int]:
+    return [st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino]
+
+
+def load_task_frontmatter(task_dir: Path, parse: Callable[[str], dict],
+                          cache_path: Path, tag: str) -> list[tuple[str, dict]]:
+    """
+    Return (path, frontmatter) for every TASK-*.md in task_dir, sorted by file name.
+
+    `parse` receives only the frontmatter head of each file (see read_frontmatter_head).
+    Parsed frontmatter is cached in cache_path keyed by file name and validated against
+    (mtime_ns, ctime_ns, size, inode), so only new or modified files are read and parsed
+    (concurrently, when there are more than a handful of them). Files modified within the
+    last couple of seconds are never cached, nor is frontmatter that JSON can't hold
+    exactly (dates are stored tagged and restored). `tag` names the parser (and its
+    version) that produced the cached entries; a cache written by another parser is
+    ignored.
+    """
+    cache = _load_fm_cache(cache_path, tag)
+    entries: dict = {}
+
+    task_entries = _iter_task_entries(task_dir)
+    task_entries.sort(key=lambda e: e.name)
+    fms: dict = {}
+    misses = []
+    racy_before = time.time_ns() - _FM_RACY_NS
+    for entry in task_entries:
+        st = entry.stat()
+        key = _stat_key(st)
+        cached = cache.get(entry.name)
+        if cached and cached.get("stat") == key and "fm" in cached:
+            fms[entry.name] = cached["fm"]
+        else:
+            misses.append(entry)
+        if st.st_mtime_ns < racy_before:
+            entries[entry.name] = {"stat": key}
+
+    if misses:
+        def _read_and_parse(entry: os.DirEntry) -> tuple[str, dict]:
+            return entry.name, parse(read_frontmatter_head(entry.path))
+
+        fms.update(pmap(_read_and_parse, misses))
+
+    missed = {entry.name for entry in misses}
+    results = []
+    for entry in task_entries:
+        fm = fms[entry.name]
+        if entry.name in entries and (entry.name not in missed or _round_trips(fm)):
+            entries[entry.name]["fm"] = fm
+        results.append((entry.path, fm))
+
+    if entries != cache:
+        _save_fm_cache(cache_path, tag, entries)
+
+    return results
+
+
+def _fmt_str(val: str) -> str:
+    # Guard: if a string looks like a JSON array (corrupted round-trip),
+    # parse it back to a list and emit properly.
+    stripped = val.strip()
+    if stripped.startswith("[") and stripped.endswith("]"):
+        try:
+            parsed = json.loads(stripped)
+            if isinstance(parsed, list):
+                return json.dumps(parsed)
+        except ValueError:
+            pass
+    return f'"{val}"'
+
+
+# Value formatter by exact type; subclasses (and anything else) go through _fmt_value's
+# isinstance checks in the original order.
+_FMT_BY_TYPE = {
+    type(None): lambda val: "null",
+    list: json.dumps,
+    str: _fmt_str,
+    float: lambda val: f"{val:.1f}",
+}
+
+
+def _fmt_mapping(val: dict) -> str:
+    """A nested mapping as one-line YAML flow style (f"{val}" would write a Python repr,
+    which doesn't read back: None becomes the string "None")."""
+    try:
+        return yaml.dump(val, Dumper=_YamlDumper, default_flow_style=True,  # type: ignore[possibly-undefined]
+                         width=2**31 - 1, allow_unicode=True, sort_keys=False).strip()
+    except yaml.YAMLError:  # type: ignore[possibly-undefined]
+        return f"{val}"
+
+
+if HAS_YAML:
+    _FMT_BY_TYPE[dict] = _fmt_mapping
+
+
+def _fmt_value(val) -> str:
+    fmt = _FMT_BY_TYPE.get(type(val))
+    if fmt is not None:
+        return fmt(val)
+    for typ in (list, str, float):
+        if isinstance(val, typ):
+            return _FMT_BY_TYPE[typ](val)
+    return f"{val}"
+
+
+def render_frontmatter(fm: dict) -> str:
+    """Render frontmatter dict back to YAML string."""
+    return "\n".join([f"{key}: {_fmt_value(val)}" for key, val in fm.items()])
+
+
+# Key order written by extract_tasks / the MCP server; the specialized renderer below
+# handles files in exactly this shape.
+_TASK_KEYS = ("id", "title", "status", "assignee", "priority", "score", "urgency", "impact",
+              "effort", "created_date", "updated_date", "due_date", "labels", "dependencies",
+              "source", "confidence")
+_TASK_STR_KEYS = ("id", "title", "status", "assignee", "priority", "created_date",
+                  "updated_date", "source")
+_TASK_NUM_KEYS = ("score", "urgency", "impact", "effort", "confidence")
+
+
+def _plain_str(val) -> bool:
+    """A str render_frontmatter would emit quoted as-is (not a JSON-array string)."""
+    if type(val) is not str:
+        return False
+    stripped = val.strip()
+    if stripped.startswith("[") and stripped.endswith("]"):
+        try:
+            return not isinstance(json.loads(stripped), list)
+        except ValueError:
+            return True  # e.g. a [[wikilink]]
+    return True
+
+
+def _fmt_num(val) -> str:
+    if val is None:
+        return "null"
+    return f"{val:.1f}" if type(val) is float else str(val)
+
+
+def render_task_frontmatter(fm: dict) -> str:
+    """
+    render_frontmatter specialized for the standard task schema: fixed key order, one
+    f-string, no per-value type dispatch. Same output; frontmatter in any other shape
+    goes through render_frontmatter.
+    """
+    n = len(_TASK_KEYS)
+    if (len(fm) < n or tuple(fm)[:n] != _TASK_KEYS
+            or not all(_plain_str(fm[k]) for k in _TASK_STR_KEYS)
+            or not all(fm[k] is None or type(fm[k]) in (int, float) for k in _TASK_NUM_KEYS)
+            or not (fm["due_date"] is None or _plain_str(fm["due_date"]))
+            or type(fm["labels"]) is not list or type(fm["dependencies"]) is not list):
+        return render_frontmatter(fm)
+
+    due = fm["due_date"]
+    due_str = "null" if due is None else f'"{due}"'
+    text = (
+        f'id: "{fm["id"]}"\n'
+        f'title: "{fm["title"]}"\n'
+        f'status: "{fm["status"]}"\n'
+        f'assignee: "{fm["assignee"]}"\n'
+        f'priority: "{fm["priority"]}"\n'
+        f'score: {_fmt_num(fm["score"])}\n'
+        f'urgency: {_fmt_num(fm["urgency"])}\n'
+        f'impact: {_fmt_num(fm["impact"])}\n'
+        f'effort: {_fmt_num(fm["effort"])}\n'
+        f'created_date: "{fm["created_date"]}"\n'
+        f'updated_date: "{fm["updated_date"]}"\n'
+        f'due_date: {due_str}\n'
+        f'labels: {json.dumps(fm["labels"])}\n'
+        f'dependencies: {json.dumps(fm["dependencies"])}\n'
+        f'source: "{fm["source"]}"\n'
+        f'confidence: {_fmt_num(fm["confidence"])}'
+    )
+    if len(fm) > n:  # e.g. completed_date
+        text += "\n" + render_frontmatter(dict(list(fm.items())[n:]))
+    return text
+
+
+def write_parts(path: str | Path, parts: list[bytes]) -> None:
+    """
+    Replace path with the concatenation of `parts`, written with a single vectored write.
+
+    Saves joining frontmatter and body into one large string first; os.writev is used
+    where the platform has it, a plain write of the joined bytes elsewhere. The data goes
+    to a sibling ".tmp" file that is then os.replace()d over path, so readers never see
+    a truncated or half-written task file.
+    """
+    tmp = f"{os.fspath(path)}.tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        try:
+            if hasattr(os, "writev"):
+                written = os.writev(fd, parts)
+                rest = b"".join(parts)[written:] if written < sum(map(len, parts)) else b""
+            else:
+                rest = b"".join(parts)
+            while rest:  # short writes are rare for regular files, but possible
+                rest = rest[os.write(fd, rest):]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def overwrite_head(path: str | Path, data: bytes) -> None:
+    """
+    Overwrite the first len(data) bytes of path in place, leaving the rest of the file
+    untouched. Callers use it when a rewritten frontmatter block has the same size.
+    """
+    fd = os.open(path, os.O_WRONLY | getattr(os, "O_BINARY", 0))
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
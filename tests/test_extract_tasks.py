@@ -0,0 +1,99 @@
+"""
+Tests for the heuristic action-item parsing in scripts/extract_tasks.py
+
+Usage:
+    python3 -m unittest discover tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from extract_tasks import extract_action_items, parse_action_item  # noqa: E402
+
+
+def _title(raw: str) -> str:
+    return parse_action_item(raw, "note.md")["title"]
+
+
+class TitleCleanupTest(unittest.TestCase):
+    """Owner tags, then the first due clause, then the first blocking clause are cut."""
+
+    def test_sample_action_items(self):
+        cases = {
+            "**@alice** — Fix JWT refresh logic for background tab token expiry — due 2026-03-03 — blocking enterprise pilot":
+                "Fix JWT refresh logic for background tab token expiry",
+            "**@bob** — Implement Redis-backed rate limiting (100 req/min per API key, 429 + Retry-After) — due 2026-03-07":
+                "Implement Redis-backed rate limiting (100 req/min per API key, 429 + Retry-After)",
+            "**@alice** — Coordinate with Acme Corp to schedule enterprise pilot after JWT fix":
+                "Coordinate with Acme Corp to schedule enterprise pilot after JWT fix",
+            "**@julien** — Wire ANTHROPIC_API_KEY into score_tasks.py LLM path — due 2026-03-07 — depends on @alice's key":
+                "Wire ANTHROPIC_API_KEY into score_tasks.py LLM path",
+            "we should probably improve the daily-brief output at some point":
+                "we should probably improve the daily-brief output at some point",
+        }
+        for raw, title in cases.items():
+            with self.subTest(raw=raw):
+                self.assertEqual(_title(raw), title)
+
+    def test_owner_tag_is_stripped(self):
+        self.assertEqual(_title("**@bob** — Ship release"), "Ship release")
+
+    def test_due_clause_is_stripped(self):
+        self.assertEqual(_title("Ship release — due Friday"), "Ship release")
+        self.assertEqual(_title("Ship release - DUE 2026-03-01"), "Ship release")
+
+    def test_blocking_clause_is_stripped(self):
+        self.assertEqual(_title("Ship release — blocked by infra — due Friday"), "Ship release")
+        self.assertEqual(_title("Ship release — depends on TASK-004"), "Ship release")
+        self.assertEqual(_title("Ship re-release - Blocked on QA"), "Ship re-release")
+
+    def test_bare_blocking_word_before_due_is_kept(self):
+        # The due clause goes first; a bare "blocked" left at the end has nothing after
+        # it, so the blocking pattern doesn't match and the signal stays in the title.
+        self.assertEqual(_title("**@bob** — Ship release — blocked — due Friday"),
+                         "Ship release — blocked")
+        self.assertEqual(_title("**@bob** — Ship release — depends on — due Friday"),
+                         "Ship release — depends on")
+
+    def test_owner_tag_after_dash_is_stripped(self):
+        self.assertEqual(_title("**@bob** — Ship release — **@amy** — due Friday"),
+                         "Ship release")
+
+
+class ExtractActionItemsTest(unittest.TestCase):
+    NOTE = ("# Sync\n## Notes\n- [ ] not an action item\n## Action Items\n"
+            "- [ ] **@bob** — First — due 2026-03-01\n  - [x] Second\nplain line\n"
+            "## Next steps\n- [ ] Outside the section\n")
+
+    def test_items_inside_section_only(self):
+        items = extract_action_items(self.NOTE)
+        self.assertEqual([item["raw"] for item in items],
+                         ["**@bob** — First — due 2026-03-01", "Second"])
+        self.assertEqual(items[1]["line"], "- [x] Second")
+
+    def test_line_endings_are_equivalent(self):
+        expected = extract_action_items(self.NOTE)
+        for eol in ("\r\n", "\r", "\u2028", "\x85"):
+            with self.subTest(eol=repr(eol)):
+                self.assertEqual(extract_action_items(self.NOTE.replace("\n", eol)), expected)
+
+
+class SampleNotesTest(unittest.TestCase):
+    def test_sprint_planning_titles_and_due_dates(self):
+        text = (REPO_ROOT / "meeting-notes" / "2026-03-05-sprint-planning.md").read_text(encoding="utf-8")
+        parsed = [parse_action_item(item["raw"], "note.md") for item in extract_action_items(text)]
+        self.assertEqual([(p["title"], p["due_date"]) for p in parsed], [
+            ("Provision Anthropic API key and add to .env file", "2026-03-05"),
+            ("Wire ANTHROPIC_API_KEY into score_tasks.py LLM path", "2026-03-07"),
+            ("Retry Backlog.md CLI install via npm and document result in C's README", "2026-03-06"),
+            ("Run full evaluation matrix with real LLM scores and fill in docs/EVALUATION.md", "2026-03-10"),
+            ("we should probably improve the daily-brief output at some point", None),
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Tests for the flat frontmatter fast path in scripts/score_tasks.py
+
+Usage:
+    python3 -m unittest discover tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import yaml
+
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from score_tasks import _flat_parse  # noqa: E402
+
+
+class FlatParseTest(unittest.TestCase):
+    """_flat_parse either agrees with yaml.safe_load or returns None to defer to it."""
+
+    def assertMatchesYaml(self, fm_text: str):
+        fm = _flat_parse(fm_text)
+        self.assertIsNotNone(fm, fm_text)
+        self.assertEqual(fm, yaml.safe_load(fm_text))
+
+    def assertDefers(self, fm_text: str):
+        self.assertIsNone(_flat_parse(fm_text), fm_text)
+
+    def test_sample_task_frontmatter(self):
+        for path in sorted((REPO_ROOT / "implementations" / "B-pure-markdown" / "tasks").glob("TASK-*.md")):
+            with self.subTest(path=path.name):
+                self.assertMatchesYaml(path.read_text(encoding="utf-8").split("---\n")[1])
+
+    def test_quoted_values_with_indicators(self):
+        for line in ('title: "Fix: login redirect"',
+                     'title: "Ship release # after QA"',
+                     "title: 'a: b # c'",
+                     'source: "[[2026-02-26-project-kickoff]]"',
+                     'title: ""'):
+            with self.subTest(line=line):
+                self.assertMatchesYaml(line)
+
+    def test_numbers(self):
+        for line in ("score: 3.6", "urgency: 5", "delta: -2", "confidence: 1.0", "n: 0"):
+            with self.subTest(line=line):
+                self.assertMatchesYaml(line)
+
+    def test_null(self):
+        for line in ("due_date: null", "due_date: ~", "due_date:", "due_date: NULL"):
+            with self.subTest(line=line):
+                self.assertMatchesYaml(line)
+
+    def test_flow_lists(self):
+        for line in ('labels: ["auth", "api"]', "labels: []", "ids: [1, 2.5]",
+                     'labels: ["a, b", "c: d"]'):
+            with self.subTest(line=line):
+                self.assertMatchesYaml(line)
+
+    def test_dates_defer_to_yaml(self):
+        # YAML reads an unquoted date as datetime.date; quoted, both keep the string.
+        self.assertDefers("due_date: 2026-03-01")
+        self.assertDefers("updated: 2026-03-01 10:00:00")
+        self.assertMatchesYaml('due_date: "2026-03-01"')
+
+    def test_booleans_defer_to_yaml(self):
+        for line in ("done: true", "done: False", "done: yes", "done: off"):
+            with self.subTest(line=line):
+                self.assertDefers(line)
+        self.assertMatchesYaml('done: "true"')
+
+    def test_yaml_only_scalars_defer(self):
+        for line in ("n: 010", "n: 1e5", "ids: [1e5]", 'title: "tab\\there"',
+                     "title: plain # comment", 'labels: "[\\"a\\"]"', "n: nuLL"):
+            with self.subTest(line=line):
+                self.assertDefers(line)
+
+    def test_block_scalars_and_nested_maps_defer(self):
+        for text in ("notes: |\n  line one\n  line two",
+                     "notes: >\n  folded",
+                     "meta:\n  owner: alice",
+                     "labels:\n  - auth\n  - api",
+                     "meta: {owner: alice}"):
+            with self.subTest(text=text):
+                self.assertDefers(text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Tests for update_task's in-place frontmatter editing in implementations/A-mcp-server/server.py
+
+Usage:
+    python3 -m unittest discover tests
+"""
+
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+_spec = importlib.util.spec_from_file_location(
+    "server", REPO_ROOT / "implementations" / "A-mcp-server" / "server.py")
+server = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(server)
+
+TASK = """---
+id: "TASK-001"
+title: "Set up Python virtualenv"
+status: "todo"
+assignee: "@alice"
+priority: "medium"
+score: 3.6
+urgency: 5
+impact: 6
+effort: 4
+created_date: "2026-02-26"
+updated_date: "2026-02-26"
+due_date: "2026-02-28"
+labels: []
+dependencies: []
+source: "[[2026-02-26-project-kickoff]]"
+confidence: 1.0
+---
+
+# Set up Python virtualenv
+
+## Notes
+"""
+
+
+def _splice(text: str, changes: dict) -> str:
+    offsets, fm_end = server._fm_line_offsets(text)
+    return "".join(server._splice_frontmatter(text, offsets, fm_end, changes))
+
+
+def _rewrite(text: str, changes: dict) -> str:
+    """The full re-render update_task falls back to for non-flat frontmatter."""
+    fm, body = server.parse_frontmatter(text)
+    fm.update(changes)
+    return f"---\n{server.render_task_frontmatter(fm)}\n---\n\n{body}"
+
+
+class SpliceFrontmatterTest(unittest.TestCase):
+    def test_replaces_existing_key_line_only(self):
+        out = _splice(TASK, {"status": "in-progress"})
+        self.assertEqual(out, TASK.replace('status: "todo"', 'status: "in-progress"'))
+
+    def test_appends_new_key_before_closing_marker(self):
+        out = _splice(TASK, {"completed_date": "2026-03-01"})
+        self.assertEqual(out, TASK.replace('confidence: 1.0\n---',
+                                           'confidence: 1.0\ncompleted_date: "2026-03-01"\n---'))
+
+    def test_value_needing_quotes(self):
+        title = "Fix: login # redirect, [draft]"
+        out = _splice(TASK, {"title": title})
+        self.assertIn(f'title: "{title}"\n', out)
+        self.assertEqual(server.parse_fm_only(out)["title"], title)
+
+    def test_list_value(self):
+        out = _splice(TASK, {"labels": ["auth", "api"]})
+        self.assertIn('labels: ["auth", "api"]\n', out)
+
+    def test_matches_full_rewrite(self):
+        cases = [
+            {"status": "review", "updated_date": "2026-03-01"},
+            {"labels": ["auth"], "due_date": "2026-03-09", "assignee": "@bob"},
+            {"title": "Fix: login # redirect", "completed_date": "2026-03-01"},
+        ]
+        for changes in cases:
+            with self.subTest(changes=changes):
+                spliced, rewritten = _splice(TASK, changes), _rewrite(TASK, changes)
+                self.assertEqual(server.parse_frontmatter(spliced),
+                                 server.parse_frontmatter(rewritten))
+                # The rewrite strips the body's trailing newline; the splice leaves it alone.
+                self.assertEqual(spliced.rstrip("\n"), rewritten)
+
+    def test_non_flat_frontmatter_is_not_spliced(self):
+        self.assertIsNone(server._fm_line_offsets("---\nlabels:\n  - a\n---\n"))
+        self.assertIsNone(server._fm_line_offsets("no frontmatter"))
+
+
+class UpdateTaskTest(unittest.TestCase):
+    def test_update_task_edits_file_in_place(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            old_dir = server.TASKS_DIR
+            server.TASKS_DIR = Path(tmp)
+            try:
+                path = Path(tmp) / "TASK-001.md"
+                path.write_text(TASK, encoding="utf-8")
+                server.tool_update_task({"id": "TASK-001", "status": "in-progress"})
+                fm, body = server.parse_frontmatter(path.read_text(encoding="utf-8"))
+            finally:
+                server.TASKS_DIR = old_dir
+        self.assertEqual(fm["status"], "in-progress")
+        self.assertEqual(fm["title"], "Set up Python virtualenv")
+        self.assertTrue(body.startswith("# Set up Python virtualenv"))
+
+
+if __name__ == "__main__":
+    unittest.main()